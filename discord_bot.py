@@ -4,23 +4,186 @@ WIP discord bot module
 https://message.style/app/editor
 """
 
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import json
+import os
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, TypeVar
 import discord
 from discord.ext import commands
 
 from wxtools.calculators import wind_chill
 from wxtools.common import cardinal_direction
-from wxtools.metar import MetarObservations
-from wxtools.wip import aviationweather_get_metar, aviationweather_get_info
-from wxtools.units import convert_unit, unit_by_label
+from wxtools.errors import AviationWeatherStationError
+from wxtools.metar import MetarObservations, SkyLayer
+from wxtools.wip import (
+    aviationweather_get_info,
+    aviationweather_get_metar,
+    aviationweather_get_metars,
+)
+from wxtools.units import convert_unit
+
+# The unit pairs used when rendering are fixed, resolve them once at import
+_KT_TO_MPH = convert_unit(1.0, "knot", "mile per hour")
+_INHG_TO_HPA = convert_unit(1.0, "inch of mercury", "hectopascal")
+_HPA_TO_INHG = 1.0 / _INHG_TO_HPA
+
+# METARs are only issued about once an hour, so they are cached for a few
+# minutes keyed by station id.
+_METAR_TTL = 300.0
+_METAR_CACHE: dict[str, tuple[float, str]] = {}
+# Fetches currently on the wire, keyed by (fetch function, station id)
+_INFLIGHT: dict[tuple[Callable[[str], Any], str], asyncio.Task[Any]] = {}
+
+_T = TypeVar("_T")
+
+
+def _data_dir() -> Path:
+    # Where the bot keeps files between runs, WXTOOLS_DATA_DIR overrides the
+    # usual per user cache directory
+    data_dir = os.environ.get("WXTOOLS_DATA_DIR")
+    if data_dir:
+        return Path(data_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home:
+        return Path(cache_home) / "wxtools"
+    return Path.home() / ".cache" / "wxtools"
+
+
+# Station names never really change, the only part of the station info the
+# reports use is the name so keep a local table of them between runs. New
+# names are written out shortly after they are found, off the event loop.
+_STATION_NAMES_FILE = _data_dir() / "station_names.json"
+_STATION_NAMES_SAVE_DELAY = 10.0
+_STATION_NAMES_DIRTY = False
+_STATION_NAMES_SAVE: asyncio.Task[None] | None = None
+
+# Stations that are unknown or have no name are not asked for again until the
+# miss expires. Failed requests are not remembered, they are retried next time.
+_STATION_NAME_MISS_TTL = 3600.0
+_STATION_NAME_MISSES_SIZE = 1024
+_STATION_NAME_MISSES: dict[str, float] = {}
+
+
+def _load_station_names() -> dict[str, str]:
+    try:
+        jdata = json.loads(_STATION_NAMES_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(jdata, dict):
+        return {}
+    return {k: v for k, v in jdata.items() if isinstance(v, str)}
+
+
+_STATION_NAMES = _load_station_names()
+
 
-_UNIT_KT = unit_by_label("knot")
-_UNIT_MPH = unit_by_label("mile per hour")
-_UNIT_C = unit_by_label("celsius")
-_UNIT_F = unit_by_label("fahrenheit")
-_UNIT_INHG = unit_by_label("inch of mercury")
-_UNIT_HPA = unit_by_label("hectopascal")
+def _write_station_names(names: dict[str, str]) -> None:
+    # Write to a temporary file first so a crash never leaves half a table
+    try:
+        _STATION_NAMES_FILE.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = _STATION_NAMES_FILE.with_suffix(".tmp")
+        temp_file.write_text(json.dumps(names), encoding="utf-8")
+        temp_file.replace(_STATION_NAMES_FILE)
+    except OSError:
+        pass
+
+
+async def _save_station_names() -> None:
+    global _STATION_NAMES_DIRTY
+    # Wait a moment so a burst of new stations is written out in one go
+    await asyncio.sleep(_STATION_NAMES_SAVE_DELAY)
+    while _STATION_NAMES_DIRTY:
+        _STATION_NAMES_DIRTY = False
+        await asyncio.to_thread(_write_station_names, dict(_STATION_NAMES))
+
+
+def _schedule_station_names_save() -> None:
+    global _STATION_NAMES_DIRTY, _STATION_NAMES_SAVE
+    _STATION_NAMES_DIRTY = True
+    if _STATION_NAMES_SAVE is None or _STATION_NAMES_SAVE.done():
+        _STATION_NAMES_SAVE = asyncio.create_task(_save_station_names())
+
+
+def _record_station_name_miss(station_id: str) -> None:
+    now = time.monotonic()
+    if len(_STATION_NAME_MISSES) >= _STATION_NAME_MISSES_SIZE:
+        # Forget expired misses, or all of them if a flood of bad ids came in
+        for sid, missed in list(_STATION_NAME_MISSES.items()):
+            if now - missed >= _STATION_NAME_MISS_TTL:
+                del _STATION_NAME_MISSES[sid]
+        if len(_STATION_NAME_MISSES) >= _STATION_NAME_MISSES_SIZE:
+            _STATION_NAME_MISSES.clear()
+    _STATION_NAME_MISSES[station_id] = now
+
+
+async def _fetch_shared(fetch: Callable[[str], _T], station_id: str) -> _T:
+    # Concurrent requests for the same station all wait on a single fetch
+    key = (fetch, station_id)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(asyncio.to_thread(fetch, station_id))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    result: _T = await asyncio.shield(task)
+    return result
+
+
+async def _cached_metar(station_id: str) -> str:
+    cached = _METAR_CACHE.get(station_id)
+    if cached is not None and time.monotonic() - cached[0] < _METAR_TTL:
+        return cached[1]
+    raw_metar = await _fetch_shared(aviationweather_get_metar, station_id)
+    _METAR_CACHE[station_id] = (time.monotonic(), raw_metar)
+    return raw_metar
+
+
+async def _cached_metars(station_ids: list[str]) -> dict[str, str]:
+    # Fresh cached reports are used as is, every other station is fetched in a
+    # single batched request. Stations without a report are left out.
+    metars: dict[str, str] = {}
+    missing: list[str] = []
+    now = time.monotonic()
+    for station_id in station_ids:
+        cached = _METAR_CACHE.get(station_id)
+        if cached is not None and now - cached[0] < _METAR_TTL:
+            metars[station_id] = cached[1]
+        else:
+            missing.append(station_id)
+    if len(missing) > 0:
+        fetched = await asyncio.to_thread(aviationweather_get_metars, missing)
+        fetched_at = time.monotonic()
+        for station_id in missing:
+            raw_metar = fetched.get(station_id)
+            if raw_metar is not None:
+                _METAR_CACHE[station_id] = (fetched_at, raw_metar)
+                metars[station_id] = raw_metar
+    return metars
+
+
+async def _station_name(station_id: str) -> str | None:
+    name = _STATION_NAMES.get(station_id)
+    if name is not None:
+        return name
+    missed = _STATION_NAME_MISSES.get(station_id)
+    if missed is not None and time.monotonic() - missed < _STATION_NAME_MISS_TTL:
+        return None
+    try:
+        info = await _fetch_shared(aviationweather_get_info, station_id)
+    except AviationWeatherStationError:
+        _record_station_name_miss(station_id)
+        return None
+    name = info.get("site")
+    if not isinstance(name, str):
+        _record_station_name_miss(station_id)
+        return None
+    _STATION_NAMES[station_id] = name
+    _schedule_station_names_save()
+    return name
 
 
 def _get_wind_str(obs: MetarObservations) -> str:
@@ -28,28 +191,24 @@ def _get_wind_str(obs: MetarObservations) -> str:
         return "Unspecified"
     if obs.wind.speed_kt == 0 and obs.wind.gust_kt is None:
         return "Calm"
-    speed_mph = convert_unit(obs.wind.speed_kt, _UNIT_KT, _UNIT_MPH)
+    speed_mph = obs.wind.speed_kt * _KT_TO_MPH
     if obs.wind.direction is None:
         return f"{speed_mph:.1f} mph from varying directions"
-    sb = f"{speed_mph:.1f} mph"
-    sb = f"{sb} from the {cardinal_direction(obs.wind.direction)}"
+    parts = [f"{speed_mph:.1f} mph from the {cardinal_direction(obs.wind.direction)}"]
     if obs.wind.gust_kt is not None:
-        gust_mph = convert_unit(obs.wind.gust_kt, _UNIT_KT, _UNIT_MPH)
-        sb = f"{sb}, gusting {gust_mph:.1f} mph"
+        gust_mph = obs.wind.gust_kt * _KT_TO_MPH
+        parts.append(f"gusting {gust_mph:.1f} mph")
     if obs.wind.variable_directions is not None:
         v1 = cardinal_direction(obs.wind.variable_directions[0])
         v2 = cardinal_direction(obs.wind.variable_directions[1])
-        sb = f"{sb}, varying from {v1} and {v2}"
-    return sb
+        parts.append(f"varying from {v1} and {v2}")
+    return ", ".join(parts)
 
 
 def _get_pw_str(obs: MetarObservations) -> str:
     if len(obs.present_weather) < 1:
         return "Unspecified"
-    sb = ""
-    for present_weather in obs.present_weather:
-        sb = f"{sb}\n- {present_weather.description()}"
-    return sb.strip()
+    return "\n".join(f"- {pw.description()}" for pw in obs.present_weather)
 
 
 def _get_vis_str(obs: MetarObservations) -> str:
@@ -58,10 +217,14 @@ def _get_vis_str(obs: MetarObservations) -> str:
     return obs.visibility.description()
 
 
+def _c_to_f(value_c: float) -> float:
+    return value_c * 1.8 + 32.0
+
+
 def _f_c_str(value_c: float | None) -> str:
     if value_c is None:
         return ""
-    value_f = convert_unit(value_c, _UNIT_C, _UNIT_F)
+    value_f = _c_to_f(value_c)
     return f"{value_f:.1f} °F ({value_c:.1f} °C)"
 
 
@@ -69,131 +232,177 @@ def _get_temp_str(obs: MetarObservations) -> str:
     temp_c = obs.temperature.temperature_c
     if temp_c is None:
         return "Unspecified"
-    temp_f = convert_unit(temp_c, _UNIT_C, _UNIT_F)
-    sb = f"- Air Temp: {temp_f:.1f} °F ({temp_c:.1f} °C)"
+    temp_f = _c_to_f(temp_c)
+    parts = [f"- Air Temp: {temp_f:.1f} °F ({temp_c:.1f} °C)"]
 
     if obs.temperature.dew_point_c is not None:
-        sb = f"{sb}\n- Dew Point: {_f_c_str(obs.temperature.dew_point_c)}"
+        parts.append(f"- Dew Point: {_f_c_str(obs.temperature.dew_point_c)}")
 
     if obs.temperature.relative_humidity is not None:
-        sb = f"{sb}\n- Relative Humidity: {obs.temperature.relative_humidity:.0f}%"
+        parts.append(f"- Relative Humidity: {obs.temperature.relative_humidity:.0f}%")
 
     if obs.temperature.wet_bulb_c is not None:
-        sb = f"{sb}\n- Wet Bulb: {_f_c_str(obs.temperature.wet_bulb_c)}"
+        parts.append(f"- Wet Bulb: {_f_c_str(obs.temperature.wet_bulb_c)}")
 
     if temp_f <= 50:
         if obs.wind is not None:
             wc_c = wind_chill(temp_c, obs.wind.speed_kt, "C", "KTS")
-            sb = f"{sb}\n- Wind Chill: {_f_c_str(wc_c)}"
+            parts.append(f"- Wind Chill: {_f_c_str(wc_c)}")
     elif obs.temperature.heat_index_c is not None:
-        sb = f"{sb}\n- Heat Index: {_f_c_str(obs.temperature.heat_index_c)}"
+        parts.append(f"- Heat Index: {_f_c_str(obs.temperature.heat_index_c)}")
 
-    return sb
+    return "\n".join(parts)
 
 
 def _get_pressure_str(obs: MetarObservations) -> str:
     alt_inhg = obs.pressure.altimeter_inhg
-    alt_hpa = convert_unit(alt_inhg, _UNIT_INHG, _UNIT_HPA)
+    alt_hpa = alt_inhg * _INHG_TO_HPA
     sb = f"- Altimeter: {alt_hpa:.1f} hPa ({alt_inhg:.2f} inHg)"
     if obs.pressure.sea_level_hpa is not None:
         slp_hpa = obs.pressure.sea_level_hpa
-        slp_inhg = convert_unit(slp_hpa, _UNIT_HPA, _UNIT_INHG)
+        slp_inhg = slp_hpa * _HPA_TO_INHG
         sb = f"{sb}\n- Sea Level: {slp_hpa:.1f} hPa ({slp_inhg:.2f} inHg)"
     return sb
 
 
+def _get_skylayer_str(cond: SkyLayer) -> str:
+    desc = cond.coverage_description
+    if cond.height_ft is None:
+        return f"- {desc} below station"
+    if cond.cb_flag:
+        return f"- {desc} at {cond.height_ft:.0f} ft (Cumulonimbus)"
+    return f"- {desc} at {cond.height_ft:.0f} ft"
+
+
 def _get_skycond_str(obs: MetarObservations) -> str:
-    if obs.sky_conditions.sky_conditions is None:
-        return "Clear skies"
-    if len(obs.sky_conditions.sky_conditions) < 1:
+    if not obs.sky_conditions.sky_conditions:
         return "Clear skies"
-    sb = ""
-    for cond in obs.sky_conditions.sky_conditions:
-        desc = cond.coverage_description
-        if cond.height_ft is not None:
-            height_str = f"at {cond.height_ft:.0f} ft"
-            if cond.cb_flag:
-                height_str = f"{height_str} (Cumulonimbus)"
-        else:
-            height_str = "below station"
-        sb = f"- {desc} {height_str}\n"
-    return sb.strip()
+    return "\n".join(_get_skylayer_str(c) for c in obs.sky_conditions.sky_conditions)
+
+
+# Upper (exclusive) bounds in °C for each temperature colour bucket
+_TEMP_EDGES = (-10, 0, 10, 20, 30, 40)
+_COLOUR_GREY = discord.Colour.from_rgb(90, 90, 90)
+_COLOUR_DARK_BLUE = discord.Colour.from_rgb(0, 0, 139)
+_COLOUR_BLUE = discord.Colour.from_rgb(0, 0, 255)
+_COLOUR_LIGHT_BLUE = discord.Colour.from_rgb(173, 216, 230)
+_COLOUR_GREEN = discord.Colour.from_rgb(0, 255, 0)
+_COLOUR_YELLOW = discord.Colour.from_rgb(255, 255, 0)
+_COLOUR_ORANGE = discord.Colour.from_rgb(255, 165, 0)
+_COLOUR_RED = discord.Colour.from_rgb(255, 0, 0)
+_TEMP_COLOURS = (
+    _COLOUR_DARK_BLUE,
+    _COLOUR_BLUE,
+    _COLOUR_LIGHT_BLUE,
+    _COLOUR_GREEN,
+    _COLOUR_YELLOW,
+    _COLOUR_ORANGE,
+    _COLOUR_RED,
+)
 
 
 def _color_from_temp(temp_c: float | None) -> discord.Colour:
     if temp_c is None:
-        return discord.Colour.from_rgb(90, 90, 90)
-    if temp_c < -10:
-        return discord.Colour.from_rgb(0, 0, 139)  # Dark Blue
-    if -10 <= temp_c < 0:
-        return discord.Colour.from_rgb(0, 0, 255)  # Blue
-    if 0 <= temp_c < 10:
-        return discord.Colour.from_rgb(173, 216, 230)  # Light Blue
-    if 10 <= temp_c < 20:
-        return discord.Colour.from_rgb(0, 255, 0)  # Green
-    if 20 <= temp_c < 30:
-        return discord.Colour.from_rgb(255, 255, 0)  # Yellow
-    if 30 <= temp_c < 40:
-        return discord.Colour.from_rgb(255, 165, 0)  # Orange
-    return discord.Colour.from_rgb(255, 0, 0)  # Red
-
-
-@dataclass
-class StationInfo:
-    """Dataclass for station information."""
-
-    name: str | None
-    latitude: float | None
-    longitude: float | None
-    elevation_m: float | None
-    state: str | None
-    country: str | None
-
-
-def _create_report_embed(
-    obs: MetarObservations, info: dict[str, Any] | None
+        return _COLOUR_GREY
+    return _TEMP_COLOURS[bisect_right(_TEMP_EDGES, temp_c)]
+
+
+# Rendering is pure CPU work, it runs in a small pool so it cannot hold up the
+# event loop (gateway heartbeats, other commands) when many reports are asked
+_EMBED_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="embed")
+
+# Rendered embeds (minus the footer) keyed by (title, coded METAR), LRU order.
+# Only ever touched from the event loop, the pool threads just build embeds.
+_EMBED_CACHE_SIZE = 256
+_EMBED_CACHE: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+
+
+async def _create_report_embed(
+    obs: MetarObservations, station_name: str | None
 ) -> discord.Embed:
 
-    # Extract station info that we care about
-    station_info = None
-    if info is not None:
-        station_info = StationInfo(
-            name=info.get("site"),
-            latitude=info.get("lat"),
-            longitude=info.get("lon"),
-            elevation_m=info.get("elev"),
-            state=info.get("state"),
-            country=info.get("country"),
-        )
-    if station_info is not None and station_info.name is not None:
-        header = f"{obs.station_id} ({station_info.name})"
+    if station_name is not None:
+        header = f"{obs.station_id} ({station_name})"
     else:
         header = obs.station_id
 
+    # Everything but the footer only depends on the METAR and station name, so
+    # reuse the serialized embed if this exact report was rendered before
+    coded_metar = str(obs.coded_metar)
+    cache_key = (header, coded_metar)
+    cached = _EMBED_CACHE.get(cache_key)
+    if cached is not None:
+        _EMBED_CACHE.move_to_end(cache_key)
+        embed = discord.Embed.from_dict(cached)
+    else:
+        embed = await asyncio.get_running_loop().run_in_executor(
+            _EMBED_POOL, _build_report_embed, obs, header, coded_metar
+        )
+        _EMBED_CACHE[cache_key] = embed.to_dict()
+        _EMBED_CACHE.move_to_end(cache_key)
+        if len(_EMBED_CACHE) > _EMBED_CACHE_SIZE:
+            _EMBED_CACHE.popitem(last=False)
+
+    # Footer = observation timestamp, relative to now so never cached
+    embed.set_footer(text=obs.observed_on())
+    return embed
+
+
+def _build_report_embed(
+    obs: MetarObservations, header: str, coded_metar: str
+) -> discord.Embed:
+
     # Create the basic body embed without fields
     embed = discord.Embed(
         title=header,
         url=f"https://www.weather.gov/wrh/timeseries?site={obs.station_id}",
         colour=_color_from_temp(obs.temperature.temperature_c),
-        description=f"```{obs.coded_metar}```",
+        description=f"```{coded_metar}```",
     )
 
-    # Footer = observation timestamp
-    embed.set_footer(text=obs.observed_on())
-
-    # Actual observation fields
-    embed.add_field(name="__Wind__", value=_get_wind_str(obs), inline=True)
-    embed.add_field(name="__Visibility__", value=_get_vis_str(obs), inline=True)
-    embed.add_field(name="", value="")
-    embed.add_field(name="__Temperature__", value=_get_temp_str(obs), inline=True)
-    embed.add_field(name="__Pressure__", value=_get_pressure_str(obs), inline=True)
-    embed.add_field(name="", value="")
-    embed.add_field(name="__Sky Condition__", value=_get_skycond_str(obs), inline=True)
-    embed.add_field(name="__Present Weather__", value=_get_pw_str(obs), inline=True)
+    # Actual observation fields, two columns with a section per observation
+    conditions = (
+        f"**Wind**\n{_get_wind_str(obs)}\n\n"
+        f"**Visibility**\n{_get_vis_str(obs)}\n\n"
+        f"**Temperature**\n{_get_temp_str(obs)}\n\n"
+        f"**Pressure**\n{_get_pressure_str(obs)}"
+    )
+    sky = (
+        f"**Sky Condition**\n{_get_skycond_str(obs)}\n\n"
+        f"**Present Weather**\n{_get_pw_str(obs)}"
+    )
+    embed.add_field(name="__Conditions__", value=conditions, inline=True)
+    embed.add_field(name="__Sky__", value=sky, inline=True)
 
     return embed
 
 
+# Discord allows at most 10 embeds in a single message, and at most 6000
+# characters across all the embeds in it
+_MAX_EMBEDS = 10
+_MAX_EMBED_CHARS = 6000
+
+
+def _embed_batches(embeds: list[discord.Embed]) -> list[list[discord.Embed]]:
+    # Pack the embeds in order into as few messages as Discord's limits allow
+    batches: list[list[discord.Embed]] = []
+    batch: list[discord.Embed] = []
+    batch_chars = 0
+    for embed in embeds:
+        embed_chars = len(embed)
+        if len(batch) > 0 and (
+            len(batch) >= _MAX_EMBEDS or batch_chars + embed_chars > _MAX_EMBED_CHARS
+        ):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(embed)
+        batch_chars += embed_chars
+    if len(batch) > 0:
+        batches.append(batch)
+    return batches
+
+
 # Create an instance of Intents and enable the ones you need
 intents = discord.Intents.default()
 intents.message_content = True
@@ -208,23 +417,90 @@ async def on_ready() -> None:
     print(f"Logged in as {bot.user}")
 
 
+async def _station_report(station_id: str) -> discord.Embed:
+    # Both requests are blocking, run them concurrently in worker threads so
+    # the event loop is free to service other commands in the meantime
+    raw_metar, station_name = await asyncio.gather(
+        _cached_metar(station_id), _station_name(station_id), return_exceptions=True
+    )
+    if isinstance(raw_metar, BaseException):
+        raise raw_metar
+    if isinstance(station_name, BaseException):
+        station_name = None
+    return await _render_report(raw_metar, station_name)
+
+
+async def _render_report(raw_metar: str, station_name: str | None) -> discord.Embed:
+    obs = MetarObservations.from_raw_string(raw_metar)
+    return await _create_report_embed(obs, station_name)
+
+
 @bot.command(name="metar")  # type: ignore
 async def metar(ctx: commands.Context, station_id: str) -> None:
     """METAR command"""
 
     try:
-        raw_metar = aviationweather_get_metar(station_id.strip().upper())
-        obs = MetarObservations.from_raw_string(raw_metar)
+        embed = await _station_report(station_id.strip().upper())
     except Exception as ex:
         await ctx.send(f"Cannot load station data. {ex}")
         return
+    await ctx.send(embed=embed)
+
+
+@bot.command(name="metar_multi")  # type: ignore
+async def metar_multi(ctx: commands.Context, *station_ids: str) -> None:
+    """METAR command for several stations at once"""
+
+    # Drop duplicates but keep the order the stations were asked in
+    sids = list(dict.fromkeys(sid.strip().upper() for sid in station_ids))
+    if len(sids) < 1:
+        await ctx.send("No station IDs specified.")
+        return
+    if len(sids) > _MAX_EMBEDS:
+        await ctx.send(f"Too many stations, at most {_MAX_EMBEDS} at a time.")
+        return
+
+    # All the METARs come from one request, the station names are looked up
+    # alongside it
+    metars_task = asyncio.create_task(_cached_metars(sids))
+    names = await asyncio.gather(
+        *(_station_name(sid) for sid in sids), return_exceptions=True
+    )
     try:
-        station_info = aviationweather_get_info(obs.station_id)
-    except Exception:
-        station_info = None
+        metars = await metars_task
+    except Exception as ex:
+        await ctx.send(f"Cannot load station data. {ex}")
+        return
+    reported = [
+        (sid, None if isinstance(name, BaseException) else name)
+        for sid, name in zip(sids, names)
+        if sid in metars
+    ]
+    results = await asyncio.gather(
+        *(_render_report(metars[sid], name) for sid, name in reported),
+        return_exceptions=True,
+    )
+    rendered = {sid: result for (sid, _), result in zip(reported, results)}
+
+    embeds: list[discord.Embed] = []
+    errors: list[str] = []
+    for sid in sids:
+        result = rendered.get(sid)
+        if result is None:
+            errors.append(f"Cannot load station data for {sid}. No METAR found.")
+        elif isinstance(result, BaseException):
+            errors.append(f"Cannot load station data for {sid}. {result}")
+        else:
+            embeds.append(result)
 
-    embed = _create_report_embed(obs, station_info)
-    await ctx.send(embed=embed)
+    if len(errors) > 0:
+        await ctx.send("\n".join(errors))
+    for batch in _embed_batches(embeds):
+        try:
+            await ctx.send(embeds=batch)
+        except discord.HTTPException as ex:
+            await ctx.send(f"Cannot send station reports. {ex}")
+            return
 
 
 @bot.command(name="metar_parse")  # type: ignore
@@ -237,11 +513,11 @@ async def metar_parse(ctx: commands.Context, metar_str: str) -> None:
         await ctx.send(f"Cannot parse data. {ex}")
         return
     try:
-        station_info = aviationweather_get_info(obs.station_id)
+        station_name = await _station_name(obs.station_id)
     except Exception:
-        station_info = None
+        station_name = None
 
-    embed = _create_report_embed(obs, station_info)
+    embed = await _create_report_embed(obs, station_name)
     await ctx.send(embed=embed)
 
 
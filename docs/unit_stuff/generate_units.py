@@ -1,6 +1,12 @@
+import hashlib
 import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 import rdflib
 import requests
 
@@ -19,6 +25,32 @@ class UnitParseError(Exception):
     pass
 
 
+_CACHE_DIR = Path(__file__).with_name(".http_cache")
+_CACHE_MAX_AGE = 86400
+
+
+def _cached_get(url: str, timeout: int, proxies: Optional[dict]) -> Path:
+    """
+    GET the url into the cache directory and return the path of the file,
+    reusing the saved copy if it is younger than _CACHE_MAX_AGE seconds. The
+    body is streamed to disk in chunks rather than held in memory as a whole.
+    """
+    cache_file = _CACHE_DIR / hashlib.sha256(url.encode("utf-8")).hexdigest()
+    if cache_file.exists():
+        if time.time() - cache_file.stat().st_mtime < _CACHE_MAX_AGE:
+            return cache_file
+    _CACHE_DIR.mkdir(exist_ok=True)
+    part_file = cache_file.with_suffix(".part")
+    with requests.get(url=url, timeout=timeout, proxies=proxies, stream=True) as resp:
+        resp.raise_for_status()
+        with part_file.open("wb") as fp:
+            for chunk in resp.iter_content(chunk_size=65536):
+                fp.write(chunk)
+    # only a complete download ever takes the cache file's place
+    part_file.replace(cache_file)
+    return cache_file
+
+
 class ParseUnitsWMO:
 
     DEFAULT_URL = "http://codes.wmo.int/common/unit?_format=jsonld"
@@ -26,6 +58,7 @@ class ParseUnitsWMO:
     def __init__(self, data: list[dict]) -> None:
         self.raw_data = data
         self.jsonld = self._filtered_json()
+        self._label_index = self._build_label_index()
 
     @classmethod
     def fetch_data(cls, **kwargs):
@@ -44,9 +77,9 @@ class ParseUnitsWMO:
                 raise TypeError("Invalid requests proxy configuration specified.")
 
         try:
-            resp = requests.get(url=url, timeout=timeout, proxies=proxies)
-            resp.raise_for_status()
-            jdata: list[dict] = resp.json()["@graph"]
+            cache_file = _cached_get(url=url, timeout=timeout, proxies=proxies)
+            with cache_file.open("rb") as fp:
+                jdata: list[dict] = json.load(fp)["@graph"]
         except Exception as ex:
             raise UnitParseError(ex) from None
 
@@ -70,25 +103,47 @@ class ParseUnitsWMO:
         filtered = UnitParse._collapse_lists(filtered)
         return filtered
 
-    def label_from_qudt_labels(self, qudt_labels: dict[str, str]) -> Optional[str]:
-        if qudt_labels is None:
-            return None
-        if not isinstance(self.jsonld, dict):
-            return None
-        folded_labels = set(s.casefold() for s in qudt_labels.values())
-        for id, info in self.jsonld.items():
+    def _build_label_index(self) -> dict[str, tuple[int, str]]:
+        # casefolded label -> (position in jsonld, short id), first entry wins
+        index: dict[str, tuple[int, str]] = {}
+        for pos, (id, info) in enumerate(self.jsonld.items()):
             if not isinstance(id, str):
                 continue
             full_label = info.get("rdfs:label")
             if not isinstance(full_label, str):
                 continue
-            if full_label.casefold() in folded_labels:
-                short_id = id.removeprefix("http://codes.wmo.int/common/unit/")
-                # Celsius is a snowflake...
-                if short_id == "Cel":
-                    short_id = "degC"
-                return short_id
-        return None
+            short_id = id.removeprefix("http://codes.wmo.int/common/unit/")
+            # Celsius is a snowflake...
+            if short_id == "Cel":
+                short_id = "degC"
+            index.setdefault(full_label.casefold(), (pos, short_id))
+        return index
+
+    def label_from_qudt_labels(self, qudt_labels: dict[str, str]) -> Optional[str]:
+        if qudt_labels is None:
+            return None
+        hits = [
+            hit
+            for s in qudt_labels.values()
+            if (hit := self._label_index.get(s.casefold())) is not None
+        ]
+        if len(hits) < 1:
+            return None
+        return min(hits)[1]
+
+
+@dataclass(slots=True)
+class UnitRecord:
+    """
+    Everything generate_units needs from a single QUDT unit
+    """
+
+    symbol: Optional[str]
+    qkinds: Optional[set]
+    en_labels: Optional[dict[str, str]]
+    ucum_code: Optional[str]
+    conv_offset: Optional[float]
+    conv_factor: Optional[float]
 
 
 class ParseUnitsQUDT:
@@ -126,9 +181,10 @@ class ParseUnitsQUDT:
                 raise TypeError("Invalid requests proxy configuration specified.")
 
         try:
-            resp = requests.get(url=url, timeout=timeout, proxies=proxies)
-            resp.raise_for_status()
-            rdf_graph = rdflib.Graph().parse(data=resp.text)
+            cache_file = _cached_get(url=url, timeout=timeout, proxies=proxies)
+            # rdflib reads the file itself instead of being handed the whole
+            # body, turtle being what it assumed for the raw text before
+            rdf_graph = rdflib.Graph().parse(source=cache_file, format="turtle")
         except Exception as ex:
             raise UnitParseError(ex) from None
 
@@ -165,11 +221,12 @@ class ParseUnitsQUDT:
         return val.replace("Â", "")
 
     def get_symbol(self, key: str) -> Optional[str]:
-
         unit_data = self.jsonld.get(key)
         if unit_data is None:
             return None
+        return self._symbol_of(unit_data)
 
+    def _symbol_of(self, unit_data: dict) -> Optional[str]:
         symbol_d = unit_data.get("symbol")
         if isinstance(symbol_d, list):
             symbol_d = symbol_d[0]
@@ -188,6 +245,9 @@ class ParseUnitsQUDT:
         unit_data = self.jsonld.get(key)
         if unit_data is None:
             return None
+        return self._qkinds_of(unit_data)
+
+    def _qkinds_of(self, unit_data: dict) -> Optional[set]:
         qkinds_d = unit_data.get("hasQuantityKind")
         qkinds = set()
         if isinstance(qkinds_d, list):
@@ -207,6 +267,9 @@ class ParseUnitsQUDT:
         unit_data = self.jsonld.get(key)
         if unit_data is None:
             return None
+        return self._en_labels_of(unit_data)
+
+    def _en_labels_of(self, unit_data: dict) -> Optional[dict[str, str]]:
         labels = {}
         label_d = unit_data.get("label")
         if isinstance(label_d, list):
@@ -230,6 +293,9 @@ class ParseUnitsQUDT:
         unit_data = self.jsonld.get(key)
         if unit_data is None:
             return None
+        return self._ucum_code_of(unit_data)
+
+    def _ucum_code_of(self, unit_data: dict) -> Optional[str]:
         ucum_code_d = unit_data.get("ucumCode")
         if isinstance(ucum_code_d, list):
             ucum_code_d = ucum_code_d[0]
@@ -244,6 +310,9 @@ class ParseUnitsQUDT:
         unit_data = self.jsonld.get(key)
         if unit_data is None:
             return None
+        return self._conv_offset_of(unit_data)
+
+    def _conv_offset_of(self, unit_data: dict) -> Optional[float]:
         conv_factor_d = unit_data.get("conversionOffset")
         if not isinstance(conv_factor_d, dict):
             return None
@@ -256,6 +325,9 @@ class ParseUnitsQUDT:
         unit_data = self.jsonld.get(key)
         if unit_data is None:
             return None
+        return self._conv_factor_of(unit_data)
+
+    def _conv_factor_of(self, unit_data: dict) -> Optional[float]:
         conv_factor_d = unit_data.get("conversionMultiplier")
         if not isinstance(conv_factor_d, dict):
             return None
@@ -264,6 +336,19 @@ class ParseUnitsQUDT:
             return None
         return float(val)
 
+    def get_all(self, key: str) -> Optional[UnitRecord]:
+        unit_data = self.jsonld.get(key)
+        if unit_data is None:
+            return None
+        return UnitRecord(
+            symbol=self._symbol_of(unit_data),
+            qkinds=self._qkinds_of(unit_data),
+            en_labels=self._en_labels_of(unit_data),
+            ucum_code=self._ucum_code_of(unit_data),
+            conv_offset=self._conv_offset_of(unit_data),
+            conv_factor=self._conv_factor_of(unit_data),
+        )
+
     def save_json(self, filepath: str) -> None:
         fpath = Path(filepath)
         if fpath.exists():
@@ -271,37 +356,46 @@ class ParseUnitsQUDT:
         with fpath.open("w", encoding="utf-8") as fp:
             return json.dump(obj=self.jsonld, fp=fp, indent=4)
 
+    @cached_property
     def _raw_json(self):
         serialized = self.raw_graph.serialize(format="json-ld")
         return json.loads(serialized)
 
-    def _raw_json_str(self, indent: int = None):
-        return json.dumps(self._raw_json(), indent=indent)
-
-    def _json_str(self, **kwargs) -> str:
-
-        fold_ns = kwargs.get("fold_namespaces")
-        if not isinstance(fold_ns, bool):
-            fold_ns = False
-
-        remove_ns = kwargs.get("remove_namespaces")
-        if not isinstance(remove_ns, bool):
-            remove_ns = False
-
-        jdata = self._raw_json_str()
-
-        if remove_ns:
-            for ns in self.raw_graph.namespaces():
-                jdata = jdata.replace(str(ns[-1]), "")
-        elif fold_ns:
-            for ns in self.raw_graph.namespaces():
-                jdata = jdata.replace(str(ns[-1]), f"{ns[0]}:")
+    def _namespace_replacer(self, fold_ns: bool) -> Callable[[str], str]:
+        """
+        Returns a function that removes every namespace of the graph from a
+        string, or folds it to its "prefix:" form if fold_ns is True.
+        """
+        prefixes = {
+            str(uri): f"{prefix}:" if fold_ns else ""
+            for prefix, uri in self.raw_graph.namespaces()
+            if str(uri)
+        }
+        if len(prefixes) < 1:
+            return lambda text: text
+        # longest first so a namespace wins over any shorter one it extends
+        pattern = re.compile(
+            "|".join(re.escape(uri) for uri in sorted(prefixes, key=len)[::-1])
+        )
+        return lambda text: pattern.sub(lambda m: prefixes[m.group(0)], text)
 
-        return jdata
+    @classmethod
+    def _replace_strings(cls, data: Any, replace: Callable[[str], str]) -> Any:
+        if isinstance(data, dict):
+            return {
+                replace(k): cls._replace_strings(v, replace) for k, v in data.items()
+            }
+        if isinstance(data, list):
+            return [cls._replace_strings(v, replace) for v in data]
+        if isinstance(data, str):
+            return replace(data)
+        return data
 
     def _filtered_json(self) -> dict[str, dict]:
-        json_str = self._json_str(remove_namespaces=True)
-        json_d: list[dict] = json.loads(json_str)
+        # strip the namespaces from the parsed structure directly rather than
+        # dumping it to a string, replacing there and loading it back
+        replace = self._namespace_replacer(fold_ns=False)
+        json_d: list[dict] = self._replace_strings(self._raw_json, replace)
         if not isinstance(json_d, list):
             raise UnitParseError("Bad raw json-ld data from source")
         if not all(isinstance(t, dict) for t in json_d):
@@ -318,9 +412,11 @@ class UnitParse:
 
     @classmethod
     def fetch_data(cls, proxies=None):
-        qudt = ParseUnitsQUDT.fetch_data(proxies=proxies)
-        wmo = ParseUnitsWMO.fetch_data(proxies=proxies)
-        return cls(qudt, wmo)
+        # the two downloads are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            qudt = pool.submit(ParseUnitsQUDT.fetch_data, proxies=proxies)
+            wmo = pool.submit(ParseUnitsWMO.fetch_data, proxies=proxies)
+            return cls(qudt.result(), wmo.result())
 
     def gen_and_print(self) -> None:
         units = self.generate_units()
@@ -338,22 +434,28 @@ class UnitParse:
             "Length": [],
             "Angle": [],
         }
-        my_unit_types = set(k for k in units.keys())
+        my_unit_types = frozenset(units)
+
+        qudt_data = self.qudt_data
+        get_all = qudt_data.get_all
+        wmo_label = self.wmo_data.label_from_qudt_labels
 
-        for id in self.qudt_data.jsonld:
+        for id in qudt_data.jsonld:
 
-            kinds = self.qudt_data.get_qkinds(id)
-            if kinds is None:
+            unit = get_all(id)
+            if unit is None or unit.qkinds is None:
                 continue
 
-            unit_type = None
-            for mu in my_unit_types:
-                if mu in kinds:
-                    unit_type = mu
-            if unit_type is None:
+            matched = my_unit_types & unit.qkinds
+            if not matched:
                 continue
+            if len(matched) == 1:
+                (unit_type,) = matched
+            else:
+                # keep the pick stable, first in the units declaration order
+                unit_type = next(mu for mu in units if mu in matched)
 
-            labels = self.qudt_data.get_en_labels(id)
+            labels = unit.en_labels
             if not isinstance(labels, dict):
                 continue
             if labels.get("en-us") is not None:
@@ -363,15 +465,15 @@ class UnitParse:
             else:
                 continue
 
-            factor = self.qudt_data.get_conv_factor(id)
+            factor = unit.conv_factor
             if factor is None:
                 continue
 
-            ucum_code = self.qudt_data.get_ucum_code(id)
-            wmo_code = self.wmo_data.label_from_qudt_labels(labels)
-            offset = self.qudt_data.get_conv_offset(id)
+            ucum_code = unit.ucum_code
+            wmo_code = wmo_label(labels)
+            offset = unit.conv_offset
 
-            symbol = self.qudt_data.get_symbol(id)
+            symbol = unit.symbol
             if symbol is None:
                 continue
 
@@ -407,18 +509,13 @@ class UnitParse:
 
     @staticmethod
     def _collapse_lists(data: dict[str, dict]) -> dict[str, dict]:
-        new_data = {}
-        for head_key, head_dict in data.items():
-            subdict = {}
-            for k, v in head_dict.items():
-                if isinstance(v, list):
-                    if len(v) == 1:
-                        subdict[k] = v[0]
-                    elif len(v) == 0:
-                        subdict[k] = None
-                    else:
-                        subdict[k] = v
-                else:
-                    subdict[k] = v
-                new_data[head_key] = subdict
-        return new_data
+        def collapse(v):
+            if isinstance(v, list) and len(v) < 2:
+                return v[0] if v else None
+            return v
+
+        return {
+            head_key: {k: collapse(v) for k, v in head_dict.items()}
+            for head_key, head_dict in data.items()
+            if len(head_dict) > 0
+        }
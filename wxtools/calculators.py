@@ -13,48 +13,83 @@ class CalculatorError(Exception):
     """Exception for calculator related errors."""
 
 
-def _convert_temperature(
-    temperature: float, current_unit: str, to_unit: str, error_check: bool = True
-) -> float:
+def _linear_conversion(from_unit: str, to_unit: str) -> tuple[float, float]:
+    offset = convert_unit(0.0, from_unit=from_unit, to_unit=to_unit)
+    factor = convert_unit(1.0, from_unit=from_unit, to_unit=to_unit) - offset
+    return factor, offset
+
+
+_TEMPERATURE_UNITS = {"C": "celsius", "F": "fahrenheit", "K": "kelvin"}
+_WIND_SPEED_UNITS = {"KTS": "knot", "MPH": "mile per hour"}
+
+# (factor, offset) pairs for every pair of supported units, so that
+# converted = value * factor + offset. These are all linear, so resolve them
+# through convert_unit once here rather than on every call.
+_TEMPERATURE_CONVERSIONS = {
+    (from_unit, to_unit): _linear_conversion(from_label, to_label)
+    for from_unit, from_label in _TEMPERATURE_UNITS.items()
+    for to_unit, to_label in _TEMPERATURE_UNITS.items()
+}
+_WIND_SPEED_CONVERSIONS = {
+    (from_unit, to_unit): _linear_conversion(from_label, to_label)[0]
+    for from_unit, from_label in _WIND_SPEED_UNITS.items()
+    for to_unit, to_label in _WIND_SPEED_UNITS.items()
+}
+
+# Upper and lower case spellings of each unit mapped to its key above, so the
+# usual unit arguments resolve with a single dict lookup instead of building
+# new strings with upper() and strip() on every call
+_TEMPERATURE_UNIT_KEYS = {
+    spelling: unit for unit in _TEMPERATURE_UNITS for spelling in (unit, unit.lower())
+}
+_WIND_SPEED_UNIT_KEYS = {
+    spelling: unit for unit in _WIND_SPEED_UNITS for spelling in (unit, unit.lower())
+}
+
+
+def _resolve_units(
+    current_unit: str, to_unit: str, unit_keys: dict[str, str]
+) -> tuple[str, str]:
+    """
+    Helper that resolves both unit arguments to their keys in unit_keys. Will
+    raise CalculatorError if specified units are incorrect or not usable.
+    """
+    conv_from = unit_keys.get(current_unit)
+    if conv_from is None:
+        conv_from = unit_keys.get(current_unit.upper().strip())
+        if conv_from is None:
+            bad_unit = current_unit.upper().strip()
+            raise CalculatorError(f"Invalid current unit specified: '{bad_unit}'")
+    conv_to = unit_keys.get(to_unit)
+    if conv_to is None:
+        conv_to = unit_keys.get(to_unit.upper().strip())
+        if conv_to is None:
+            bad_unit = to_unit.upper().strip()
+            raise CalculatorError(f"Invalid convert to unit specified: '{bad_unit}'")
+    return conv_from, conv_to
+
+
+def _convert_temperature(temperature: float, current_unit: str, to_unit: str) -> float:
     """
     Helper method for converting temperature values to C and F. Also will raise
     CalculatorError if specified units are incorrect or not usable.
     """
-    valid_units = {"C": "celsius", "F": "fahrenheit", "K": "kelvin"}
-    conv_from = current_unit.upper().strip()
-    conv_to = to_unit.upper().strip()
-    if error_check:
-        if conv_from not in valid_units:
-            raise CalculatorError(f"Invalid current unit specified: '{conv_from}'")
-        if conv_to not in valid_units:
-            raise CalculatorError(f"Invalid convert to unit specified: '{conv_to}'")
-    if conv_from == conv_to:
+    units = _resolve_units(current_unit, to_unit, _TEMPERATURE_UNIT_KEYS)
+    if units[0] == units[1]:
         return temperature
-    return convert_unit(
-        temperature, from_unit=valid_units[conv_from], to_unit=valid_units[conv_to]
-    )
+    factor, offset = _TEMPERATURE_CONVERSIONS[units]
+    return temperature * factor + offset
 
 
-def _convert_wind_speed(
-    wind_speed: float, current_unit: str, to_unit: str, error_check: bool = True
-) -> float:
+def _convert_wind_speed(wind_speed: float, current_unit: str, to_unit: str) -> float:
     """
     Helper method for converting wind speed values to MPH and KTS. Also will
     raise CalculatorError if specified units are incorrect or not usable.
     """
-    valid_units = ("KTS", "MPH")
-    conv_from = current_unit.upper().strip()
-    conv_to = to_unit.upper().strip()
-    if error_check:
-        if conv_from not in valid_units:
-            raise CalculatorError(f"Invalid current unit specified: '{conv_from}'")
-        if conv_to not in valid_units:
-            raise CalculatorError(f"Invalid convert to unit specified: '{conv_to}'")
-    if conv_from == conv_to:
+    units = _resolve_units(current_unit, to_unit, _WIND_SPEED_UNIT_KEYS)
+    if units[0] == units[1]:
         return wind_speed
-    if conv_from == "MPH" and conv_to == "KTS":
-        return convert_unit(wind_speed, from_unit="mile per hour", to_unit="knot")
-    return convert_unit(wind_speed, from_unit="knot", to_unit="mile per hour")
+    return wind_speed * _WIND_SPEED_CONVERSIONS[units]
 
 
 def _simple_heat_index(temp_f: float, rh: float) -> float:
@@ -63,17 +98,12 @@ def _simple_heat_index(temp_f: float, rh: float) -> float:
 
 
 def _rothfusz_heat_index(temp_f: float, rh: float) -> float:
-    return (
-        -42.379
-        + 2.04901523 * temp_f
-        + 10.14333127 * rh
-        - 0.22475541 * temp_f * rh
-        - 0.00683783 * temp_f * temp_f
-        - 0.05481717 * rh * rh
-        + 0.00122874 * temp_f * temp_f * rh
-        + 0.00085282 * temp_f * rh * rh
-        - 0.00000199 * temp_f * temp_f * rh * rh
-    )
+    # Rothfusz regression grouped by powers of temperature and evaluated in
+    # Horner form, 8 multiplies instead of 18 for the expanded polynomial
+    c0 = -42.379 + rh * (10.14333127 - 0.05481717 * rh)
+    c1 = 2.04901523 + rh * (-0.22475541 + 0.00085282 * rh)
+    c2 = -0.00683783 + rh * (0.00122874 - 0.00000199 * rh)
+    return c0 + temp_f * (c1 + temp_f * c2)
 
 
 def _adjust_heat_index(hi: float, temp_f: float, rh: float) -> float:
@@ -88,12 +118,62 @@ def _adjust_heat_index(hi: float, temp_f: float, rh: float) -> float:
     return hi
 
 
+def _heat_index_f(temp_f: float, rh: float) -> float:
+    # First, use the simple formula, and use it if value is < 80F
+    hi_result = _simple_heat_index(temp_f, rh)
+    if hi_result >= 80:
+        # Value was >= 80F, use the Rothfusz method
+        hi_result = _rothfusz_heat_index(temp_f, rh)
+        # Make adjustments for high and low RH if needed before returning
+        hi_result = _adjust_heat_index(hi_result, temp_f, rh)
+    return hi_result
+
+
+def _wind_chill_f(temp_f: float, wind_mph: float) -> float:
+    # Both wind terms share wind_mph**0.16, so take the power once
+    return 35.74 + 0.6215 * temp_f + (0.4275 * temp_f - 35.75) * wind_mph**0.16
+
+
+# Magnus form coefficients, svp = base * exp(a * t / (t + b)), above freezing
+# using the August-Roche-Magnus fit over water by Alduchov and Eskridge, and
+# Murray's Tetens fit over ice below freezing. Each fit keeps its own base, so
+# svp steps up by about 0.0016 hPa at 0 °C
+_MAGNUS_WATER = (6.1094, 17.625, 243.04)
+_MAGNUS_ICE = (6.1078, 21.875, 265.5)
+
+
+def _magnus_c(temp_c: float) -> float:
+    base, a, b = _MAGNUS_WATER if temp_c >= 0 else _MAGNUS_ICE
+    return base * math.exp((a * temp_c) / (temp_c + b))
+
+
+def _relative_humidity_c(temp_c: float, dp_c: float) -> float:
+    # With both values on the same branch the bases cancel and the ratio of
+    # the two exponentials collapses to exp(a * b * (td - t) / ((td + b)(t + b)))
+    if (temp_c >= 0) == (dp_c >= 0):
+        _, a, b = _MAGNUS_WATER if temp_c >= 0 else _MAGNUS_ICE
+        return math.exp(a * b * (dp_c - temp_c) / ((dp_c + b) * (temp_c + b))) * 100
+    return _magnus_c(dp_c) / _magnus_c(temp_c) * 100
+
+
+def _wet_bulb_c(temp_c: float, rh: float) -> float:
+    return (
+        (temp_c * math.atan(0.151977 * ((rh + 8.313659) ** 0.5)))
+        + math.atan(temp_c + rh)
+        - math.atan(rh - 1.676331)
+        + (0.00391838 * (rh**1.5) * math.atan(0.023101 * rh))
+        - 4.686035
+    )
+
+
 def saturation_vapor_pressure(temperature: float, unit: str) -> float:
     """
     Calculates saturation vapour pressure of water given the specified
-    temperature in degrees using Tetens equation. Will return the pressure in
-    hPa.
+    temperature in degrees using the August-Roche-Magnus approximation over
+    water, and Tetens equation over ice below freezing. Will return the
+    pressure in hPa.
 
+    https://doi.org/10.1175/1520-0450(1996)035<0601:IMFAOS>2.0.CO;2
     https://en.wikipedia.org/wiki/Tetens_equation
 
     Parameters:
@@ -101,9 +181,7 @@ def saturation_vapor_pressure(temperature: float, unit: str) -> float:
         * unit (str) -- Unit of the values, either 'C' or 'F'.
     """
     temp_c = _convert_temperature(temperature, current_unit=unit, to_unit="C")
-    if temp_c >= 0:
-        return 6.1078 * math.exp((17.27 * temp_c) / (temp_c + 237.3))
-    return 6.1078 * math.exp((21.875 * temp_c) / (temp_c + 265.5))
+    return _magnus_c(temp_c)
 
 
 def relative_humidity(temperature: float, dew_point: float, unit: str) -> float:
@@ -122,9 +200,7 @@ def relative_humidity(temperature: float, dew_point: float, unit: str) -> float:
     """
     temp_c = _convert_temperature(temperature, current_unit=unit, to_unit="C")
     dp_c = _convert_temperature(dew_point, current_unit=unit, to_unit="C")
-    actual_vapor_pressure = saturation_vapor_pressure(dp_c, "C")
-    sat_vapor_pressure = saturation_vapor_pressure(temp_c, "C")
-    return round((actual_vapor_pressure / sat_vapor_pressure) * 100, 2)
+    return round(_relative_humidity_c(temp_c, dp_c), 2)
 
 
 def heat_index(temperature: float, rel_humidity: float, unit: str) -> float:
@@ -143,16 +219,8 @@ def heat_index(temperature: float, rel_humidity: float, unit: str) -> float:
         * unit (str) -- Unit of the values, either 'C' or 'F'.
     """
     temp_f = _convert_temperature(temperature, current_unit=unit, to_unit="F")
-    # First, use the simple formula, and use it if value is < 80F
-    hi_result = _simple_heat_index(temp_f, rel_humidity)
-    if hi_result >= 80:
-        # Value was >= 80F, use the Rothfusz method
-        hi_result = _rothfusz_heat_index(temp_f, rel_humidity)
-        # Make adjustments for high and low RH if needed before returning
-        hi_result = _adjust_heat_index(hi_result, temp_f, rel_humidity)
-    return _convert_temperature(
-        hi_result, current_unit="F", to_unit=unit, error_check=False
-    )
+    hi_result = _heat_index_f(temp_f, rel_humidity)
+    return _convert_temperature(hi_result, current_unit="F", to_unit=unit)
 
 
 def wind_chill(
@@ -174,15 +242,8 @@ def wind_chill(
     """
     temp_f = _convert_temperature(temperature, current_unit=temp_unit, to_unit="F")
     wind_mph = _convert_wind_speed(wind_speed, current_unit=wind_unit, to_unit="MPH")
-    wind_chill_f: float = (
-        35.74
-        + 0.6215 * temp_f
-        - 35.75 * (wind_mph**0.16)
-        + 0.4275 * temp_f * (wind_mph**0.16)
-    )
-    return _convert_temperature(
-        wind_chill_f, current_unit="F", to_unit=temp_unit, error_check=False
-    )
+    wind_chill_f = _wind_chill_f(temp_f, wind_mph)
+    return _convert_temperature(wind_chill_f, current_unit="F", to_unit=temp_unit)
 
 
 def wet_bulb(temperature: float, rel_humidity: float, unit: str) -> float:
@@ -199,14 +260,8 @@ def wet_bulb(temperature: float, rel_humidity: float, unit: str) -> float:
         * unit (str) -- Unit of the values, either 'C' or 'F'.
     """
     temp_c = _convert_temperature(temperature, current_unit=unit, to_unit="C")
-    wb_c: float = (
-        (temp_c * math.atan(0.151977 * ((rel_humidity + 8.313659) ** 0.5)))
-        + math.atan(temp_c + rel_humidity)
-        - math.atan(rel_humidity - 1.676331)
-        + (0.00391838 * (rel_humidity**1.5) * math.atan(0.023101 * rel_humidity))
-        - 4.686035
-    )
-    return _convert_temperature(wb_c, current_unit="C", to_unit=unit, error_check=False)
+    wb_c = _wet_bulb_c(temp_c, rel_humidity)
+    return _convert_temperature(wb_c, current_unit="C", to_unit=unit)
 
 
 def feels_like(
@@ -231,9 +286,7 @@ def feels_like(
     temp_f = _convert_temperature(temperature, current_unit=temp_unit, to_unit="F")
     wind_mph = _convert_wind_speed(wind_speed, current_unit=wind_unit, to_unit="MPH")
     if temp_f <= 50:
-        feeling_f = wind_chill(temp_f, wind_mph, "F", "MPH")
+        feeling_f = _wind_chill_f(temp_f, wind_mph)
     else:
-        feeling_f = heat_index(temp_f, rel_humidity, "F")
-    return _convert_temperature(
-        feeling_f, current_unit="F", to_unit=temp_unit, error_check=False
-    )
+        feeling_f = _heat_index_f(temp_f, rel_humidity)
+    return _convert_temperature(feeling_f, current_unit="F", to_unit=temp_unit)
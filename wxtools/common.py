@@ -4,8 +4,7 @@ Common helper methods used in various modules.
 
 from __future__ import annotations
 
-from fractions import Fraction
-from typing import Any
+from typing import Any, Sequence
 
 _CARDINAL_FULLNAMES = (
     "North",
@@ -64,13 +63,36 @@ _CARDINAL_ABBREVIATED = (
     "NNW",
 )
 
+_CARDINAL_SHORTARROWS = tuple(
+    f"{abbr} {arrow}" for abbr, arrow in zip(_CARDINAL_ABBREVIATED, _CARDINAL_ARROWS)
+)
+
+# Name table for each style of cardinal_direction, 'degrees' is not a lookup
+_CARDINAL_STYLES = {
+    "short": _CARDINAL_ABBREVIATED,
+    "long": _CARDINAL_FULLNAMES,
+    "arrow": _CARDINAL_ARROWS,
+    "shortarrow": _CARDINAL_SHORTARROWS,
+}
+_CARDINAL_STYLE_NAMES = frozenset((*_CARDINAL_STYLES, "degrees"))
+
+# Index into the tables above for every whole degree. Wind directions are
+# reported as integers, so the rounding math only runs for anything else.
+_CARDINAL_INDEXES = tuple(int(round(degrees / 22.5) % 16) for degrees in range(361))
+
 
 def fraction_str_to_float(fractional: str) -> float:
     """Converts a string with fractions to a floating point number."""
     parts = fractional.split()
+    whole = 0
+    fraction = parts[0]
     if len(parts) == 2:
-        return round(int(parts[0]) + float(Fraction(parts[1])), 2)
-    return round(float(Fraction(parts[0])), 2)
+        whole = int(parts[0])
+        fraction = parts[1]
+    numerator, slash, denominator = fraction.partition("/")
+    if not slash:
+        return round(whole + float(numerator), 2)
+    return round(whole + int(numerator) / int(denominator), 2)
 
 
 def quotify(value: Any) -> str:
@@ -81,6 +103,14 @@ def quotify(value: Any) -> str:
     return f"'{value}'" if isinstance(value, str) else str(value)
 
 
+def _cardinal_style(style: str) -> str:
+    # Callers nearly always pass one of the lowercase names already, which
+    # saves building a casefolded copy of the string
+    if style in _CARDINAL_STYLE_NAMES:
+        return style
+    return style.casefold()
+
+
 def cardinal_direction(direction: int, style: str = "shortarrow") -> str:
     """
     The cardinal direction of the specified wind direction value.
@@ -98,16 +128,37 @@ def cardinal_direction(direction: int, style: str = "shortarrow") -> str:
     * 'shortarrow -> 'NE ⬋'
     * 'degrees' -> '45°'
     """
-    cfstyle = style.casefold()
-    cardinal_index = int(round(direction / 22.5) % 16)
-    if cfstyle == "shortarrow":
-        arrow = _CARDINAL_ARROWS[cardinal_index]
-        abbr = _CARDINAL_ABBREVIATED[cardinal_index]
-        return f"{abbr} {arrow}"
-    if cfstyle == "arrow":
-        return _CARDINAL_ARROWS[cardinal_index]
-    if cfstyle == "long":
-        return _CARDINAL_FULLNAMES[cardinal_index]
+    cfstyle = _cardinal_style(style)
     if cfstyle == "degrees":
         return f"{direction}°"
-    return _CARDINAL_ABBREVIATED[cardinal_index]
+    names = _CARDINAL_STYLES.get(cfstyle, _CARDINAL_ABBREVIATED)
+    if isinstance(direction, int) and 0 <= direction <= 360:
+        return names[_CARDINAL_INDEXES[direction]]
+    return names[int(round(direction / 22.5) % 16)]
+
+
+def cardinal_directions(
+    directions: Sequence[int], style: str = "shortarrow"
+) -> list[str]:
+    """
+    The cardinal directions of many wind direction values at once, e.g. a
+    station time series. Same as calling cardinal_direction() on each value,
+    but the style is only resolved once for the whole sequence.
+
+    Parameters:
+    * directions (Sequence[int]) -- Directions of wind in 0-360 degrees.
+    * style (str) -- The style of strings to be returned, see
+    cardinal_direction() for possible values. Defaults to 'shortarrow'.
+    """
+    cfstyle = _cardinal_style(style)
+    if cfstyle == "degrees":
+        return [f"{direction}°" for direction in directions]
+    names = _CARDINAL_STYLES.get(cfstyle, _CARDINAL_ABBREVIATED)
+    return [
+        (
+            names[_CARDINAL_INDEXES[direction]]
+            if isinstance(direction, int) and 0 <= direction <= 360
+            else names[int(round(direction / 22.5) % 16)]
+        )
+        for direction in directions
+    ]
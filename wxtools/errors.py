@@ -24,6 +24,10 @@ class AviationWeatherError(Exception):
     """Exception for aviationweather.gov API requests."""
 
 
+class AviationWeatherStationError(AviationWeatherError):
+    """Exception raised when aviationweather.gov does not know a station."""
+
+
 @dataclass
 class NwsErrorDetails:
     """
@@ -3,27 +3,30 @@ Experimenting with parsing METAR data into a python object.
 """
 
 from __future__ import annotations
+import re
+import time
+from collections import deque
 from datetime import datetime, timezone
 from dataclasses import dataclass
+from typing import Iterable
 
 from .common import cardinal_direction, quotify, fraction_str_to_float
 from . import calculators
 
+# A whole remarks token, i.e. bounded by whitespace or the ends of the string,
+# same as looking through metar_remarks.split() for it
+_SLP_REMARK = re.compile(r"(?<!\S)SLP\S{3}(?!\S)")
+_TEMP_REMARK = re.compile(r"(?<!\S)T[01]\S{3}[01]\S{3}(?!\S)")
+
 
 def _remarks_slp(metar_remarks: str) -> str | None:
-    for remark in metar_remarks.upper().split():
-        if remark.startswith("SLP") and len(remark) == 6:
-            return remark
-    return None
+    match = _SLP_REMARK.search(metar_remarks.upper())
+    return None if match is None else match.group()
 
 
 def _remarks_temp(metar_remarks: str) -> str | None:
-    for remark in metar_remarks.upper().split():
-        if remark.startswith("T1") or remark.startswith("T0"):
-            if len(remark) == 9:
-                if remark[5] == "0" or remark[5] == "1":
-                    return remark
-    return None
+    match = _TEMP_REMARK.search(metar_remarks.upper())
+    return None if match is None else match.group()
 
 
 @dataclass
@@ -50,6 +53,34 @@ class SkyLayer:
         return self.descriptions[self.coverage]
 
 
+# Sky cover abbreviations that start a sky condition group, only the keys of
+# SkyLayer.descriptions are needed while splitting up the coded groups. A tuple
+# so str.startswith() can check them all without slicing the group.
+_SKY_PREFIXES = tuple(SkyLayer.descriptions)
+
+
+_SKY_LAYER = r"(?:(?:FEW|SCT|BKN|OVC)\d{3}(?:CB|TCU)?|VV\d{3}|CLR|SKC)"
+
+# The common shape of a METAR body (everything before RMK), one group per
+# CodedMetar attribute. It only accepts groups that CodedMetar._split_groups
+# would split up the same way, so a match gives the same result and anything
+# unusual is left to that parser.
+_METAR_BODY = re.compile(
+    r"(?:(METAR|SPECI) )?"
+    r"([A-Z0-9]{4}) "
+    r"(\d{6}Z)"
+    r"(?: (AUTO|COR))?"
+    r" ((?:\d{3}|VRB)\d{2,3}(?:G\d{2,3})?KT(?: \d{3}V\d{3})?)"
+    r" ((?:\d{1,2} )?[MP]?\d{1,4}(?:/\d{1,2})?SM)"
+    r"(?: (R\d{2}[LRC]?/\S+FT))?"
+    r"((?: (?!FEW|SCT|BKN|OVC|VV|CLR|SKC)[-+]?[A-Z]{2,8})*?)"
+    rf" ({_SKY_LAYER}(?: {_SKY_LAYER})*)"
+    r" (M?\d{2}/(?:M?\d{2})?)"
+    r" (A\d{4})",
+    re.ASCII,
+)
+
+
 class CodedMetar:
     """
     Python object for storing a METAR/SPECI string. Splits the groups out into
@@ -58,6 +89,21 @@ class CodedMetar:
     if they are not present.
     """
 
+    __slots__ = (
+        "report_type",
+        "station_id",
+        "date_time",
+        "report_modifier",
+        "wind",
+        "visibility",
+        "runway_visual_range",
+        "altimeter",
+        "temperature",
+        "sky_condition",
+        "present_weather",
+        "remarks",
+    )
+
     _report_types = {
         "METAR": "Hourly, scheduled report",
         "SPECI": "Special, unscheduled report",
@@ -77,8 +123,34 @@ class CodedMetar:
         """
         # Split off remarks section
         split_obs = metar_observation.upper().split(" RMK ", maxsplit=2)
-        # Split observations out into a list and quickly check length
-        observations = split_obs[0].split()
+        # Well formed reports are split up by one regex match, anything it does
+        # not cover goes through the group by group parsing below
+        match = _METAR_BODY.fullmatch(split_obs[0].strip())
+        if match is not None:
+            (
+                self.report_type,
+                self.station_id,
+                self.date_time,
+                self.report_modifier,
+                self.wind,
+                self.visibility,
+                self.runway_visual_range,
+                present_weather,
+                self.sky_condition,
+                self.temperature,
+                self.altimeter,
+            ) = match.groups()
+            self.present_weather = present_weather[1:] or None
+        else:
+            self._split_groups(split_obs[0])
+        # Just keep remarks as a single unsplit string
+        self.remarks = None
+        if len(split_obs) > 1:
+            self.remarks = split_obs[1]
+
+    def _split_groups(self, metar_body: str) -> None:
+        # Split observations out into a deque, groups are taken off both ends
+        observations = deque(metar_body.split())
         if len(observations) < 7:
             raise RuntimeError(
                 "Invalid METAR string, not enough parts "
@@ -98,58 +170,50 @@ class CodedMetar:
         self.sky_condition = self._pop_sky_condition(observations)
         # We handled everything but weather phenomena, so combine the rest
         self.present_weather = self._pop_present_weather(observations)
-        # Just keep remarks as a single unsplit string
-        self.remarks = None
-        if len(split_obs) > 1:
-            self.remarks = split_obs[1]
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    report_type={quotify(self.report_type)},\n"
-        sb = f"{sb}    station_id={quotify(self.station_id)},\n"
-        sb = f"{sb}    date_time={quotify(self.date_time)},\n"
-        sb = f"{sb}    report_modifier={quotify(self.report_modifier)},\n"
-        sb = f"{sb}    wind={quotify(self.wind)},\n"
-        sb = f"{sb}    visibility={quotify(self.visibility)},\n"
-        sb = f"{sb}    runway_visual_range={quotify(self.runway_visual_range)},\n"
-        sb = f"{sb}    present_weather={quotify(self.present_weather)},\n"
-        sb = f"{sb}    sky_condition={quotify(self.sky_condition)},\n"
-        sb = f"{sb}    temperature={quotify(self.temperature)},\n"
-        sb = f"{sb}    altimeter={quotify(self.altimeter)},\n"
-        sb = f"{sb}    remarks={quotify(self.remarks)},\n"
-        return f"{sb})"
+        fields = (
+            ("report_type", self.report_type),
+            ("station_id", self.station_id),
+            ("date_time", self.date_time),
+            ("report_modifier", self.report_modifier),
+            ("wind", self.wind),
+            ("visibility", self.visibility),
+            ("runway_visual_range", self.runway_visual_range),
+            ("present_weather", self.present_weather),
+            ("sky_condition", self.sky_condition),
+            ("temperature", self.temperature),
+            ("altimeter", self.altimeter),
+            ("remarks", self.remarks),
+        )
+        body = "".join(f"    {name}={quotify(value)},\n" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body})"
 
     def __str__(self) -> str:
-        if self.report_type is not None:
-            sb = f"{self.report_type} "
-        else:
-            sb = ""
-        sb = f"{sb}{self.station_id} {self.date_time}"
-        if self.report_modifier is not None:
-            sb = f"{sb} {self.report_modifier}"
-        if self.wind is not None:
-            sb = f"{sb} {self.wind}"
-        if self.visibility is not None:
-            sb = f"{sb} {self.visibility}"
-        if self.runway_visual_range is not None:
-            sb = f"{sb} {self.runway_visual_range}"
-        if self.present_weather is not None:
-            sb = f"{sb} {self.present_weather}"
-        sb = f"{sb} {self.sky_condition}"
-        if self.temperature is not None:
-            sb = f"{sb} {self.temperature}"
-        sb = f"{sb} {self.altimeter}"
+        groups = [
+            self.report_type,
+            self.station_id,
+            self.date_time,
+            self.report_modifier,
+            self.wind,
+            self.visibility,
+            self.runway_visual_range,
+            self.present_weather,
+            self.sky_condition,
+            self.temperature,
+            self.altimeter,
+        ]
         if self.remarks is not None:
-            sb = f"{sb} RMK {self.remarks}"
-        return sb
+            groups.append(f"RMK {self.remarks}")
+        return " ".join(group for group in groups if group is not None)
 
-    def _pop_report_type(self, observations: list[str]) -> str | None:
+    def _pop_report_type(self, observations: deque[str]) -> str | None:
         if observations[0] in self._report_types:
-            return observations.pop(0)
+            return observations.popleft()
         return None
 
-    def _pop_station(self, observations: list[str]) -> str:
-        station_id = observations.pop(0)
+    def _pop_station(self, observations: deque[str]) -> str:
+        station_id = observations.popleft()
         if len(station_id) != 4:
             raise RuntimeError(
                 f"Invalid station ID '{station_id}', "
@@ -157,53 +221,55 @@ class CodedMetar:
             )
         return station_id
 
-    def _pop_date_time(self, observations: list[str]) -> str:
-        date_time = observations.pop(0)
-        if len(date_time) != 7:
-            raise RuntimeError(
-                f"Invalid date/time '{date_time}', not 7 ({len(date_time)}) characters."
-            )
-        if date_time[-1] != "Z":
+    def _pop_date_time(self, observations: deque[str]) -> str:
+        date_time = observations.popleft()
+        # One test on the happy path, work out which check failed afterwards
+        if len(date_time) != 7 or date_time[6] != "Z":
+            if len(date_time) != 7:
+                raise RuntimeError(
+                    f"Invalid date/time '{date_time}', "
+                    f"not 7 ({len(date_time)}) characters."
+                )
             raise RuntimeError(f"Invalid date/time '{date_time}', does not end in 'Z'.")
         return date_time
 
-    def _pop_report_mod(self, observations: list[str]) -> str | None:
+    def _pop_report_mod(self, observations: deque[str]) -> str | None:
         if observations[0] in self._report_mods:
-            return observations.pop(0)
+            return observations.popleft()
         return None
 
-    def _pop_wind(self, observations: list[str]) -> str | None:
+    def _pop_wind(self, observations: deque[str]) -> str | None:
         if len(observations[0]) < 7:
             return None
         if not observations[0].endswith("KT"):
             return None
-        wind_dir_spd = observations.pop(0)
+        wind_dir_spd = observations.popleft()
         # If variable wind exists, it needs to be immediatly after
         if len(observations[0]) == 7 and observations[0][3] == "V":
-            wind_dir_spd = f"{wind_dir_spd} {observations.pop(0)}"
+            wind_dir_spd = f"{wind_dir_spd} {observations.popleft()}"
         return wind_dir_spd
 
-    def _pop_visibility(self, observations: list[str]) -> str | None:
+    def _pop_visibility(self, observations: deque[str]) -> str | None:
         if not observations[0].endswith("SM"):
             if not observations[1].endswith("SM"):
                 return None
-        visibility = observations.pop(0)
+        visibility = observations.popleft()
         if not visibility.endswith("SM"):
             # There could be spaces in this group, for fractional numbers
             if observations[0].endswith("SM"):
-                visibility = f"{visibility} {observations.pop(0)}"
+                visibility = f"{visibility} {observations.popleft()}"
             else:
                 raise RuntimeError(
                     f"Invalid visibility '{visibility}', string does not end in SM."
                 )
         return visibility
 
-    def _pop_runway_visual(self, observations: list[str]) -> str | None:
+    def _pop_runway_visual(self, observations: deque[str]) -> str | None:
         if observations[0].startswith("R") and observations[0].endswith("FT"):
-            return observations.pop(0)
+            return observations.popleft()
         return None
 
-    def _pop_altimeter(self, observations: list[str]) -> str:
+    def _pop_altimeter(self, observations: deque[str]) -> str:
         altimeter = observations.pop()
         if len(altimeter) < 3:
             raise RuntimeError(f"Invalid altimeter '{altimeter}', invalid length.")
@@ -213,22 +279,24 @@ class CodedMetar:
             )
         return altimeter
 
-    def _pop_temp_dew(self, observations: list[str]) -> str | None:
-        if observations[-1][2] != "/" and observations[-1][3] != "/":
+    def _pop_temp_dew(self, observations: deque[str]) -> str | None:
+        # Temperature is 2 digits, or 3 when negative ("M05"), before the slash
+        if "/" not in observations[-1][2:4]:
             return None
         return observations.pop()
 
-    def _pop_sky_condition(self, observations: list[str]) -> str:
-        sky_condition = ""
-        for group in reversed(observations):
+    def _pop_sky_condition(self, observations: deque[str]) -> str:
+        sky_layers: list[str] = []
+        while len(observations) > 0:
+            group = observations[-1]
             if len(group) < 3:
                 break
-            if group[0:3] not in SkyLayer.descriptions:
+            if not group.startswith(_SKY_PREFIXES):
                 break
-            sky_condition = f"{observations.pop()} {sky_condition}"
-        return sky_condition.strip()
+            sky_layers.append(observations.pop())
+        return " ".join(reversed(sky_layers))
 
-    def _pop_present_weather(self, observations: list[str]) -> str | None:
+    def _pop_present_weather(self, observations: deque[str]) -> str | None:
         if len(observations) < 1:
             return None
         return " ".join(observations)
@@ -241,16 +309,45 @@ class CodedMetar:
         return MetarObservations(self)
 
 
+# English month names for observed_on(), strftime's %B depends on the locale
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
 class MetarObservations:
     """
     Object for a observation stations data, specifically extracted and decoded
     from a METAR.
     """
 
-    def __init__(self, coded_metar: CodedMetar) -> None:
+    __slots__ = (
+        "coded_metar",
+        "station_id",
+        "timestamp",
+        "wind",
+        "visibility",
+        "pressure",
+        "temperature",
+        "sky_conditions",
+        "present_weather",
+    )
+
+    def __init__(self, coded_metar: CodedMetar, now: datetime | None = None) -> None:
         self.coded_metar = coded_metar
         self.station_id = self.coded_metar.station_id
-        self.timestamp = self._parse_date_time(self.coded_metar.date_time)
+        self.timestamp = self._parse_date_time(self.coded_metar.date_time, now)
         self.wind = None
         if self.coded_metar.wind is not None:
             self.wind = MetarWind(self.coded_metar.wind)
@@ -263,17 +360,19 @@ class MetarObservations:
         self.present_weather = self._get_present_weather()
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    coded_metar={quotify(self.coded_metar)},\n"
-        sb = f"{sb}    station_id={quotify(self.station_id)},\n"
-        sb = f"{sb}    timestamp={quotify(self.timestamp)},\n"
-        sb = f"{sb}    wind={quotify(self.wind)},\n"
-        sb = f"{sb}    visibility={quotify(self.visibility)},\n"
-        sb = f"{sb}    pressure={quotify(self.pressure)},\n"
-        sb = f"{sb}    temperature={quotify(self.temperature)},\n"
-        sb = f"{sb}    sky_conditions={quotify(self.sky_conditions)},\n"
-        sb = f"{sb}    present_weather={quotify(self.present_weather)}\n"
-        return f"{sb})"
+        fields = (
+            ("coded_metar", self.coded_metar),
+            ("station_id", self.station_id),
+            ("timestamp", self.timestamp),
+            ("wind", self.wind),
+            ("visibility", self.visibility),
+            ("pressure", self.pressure),
+            ("temperature", self.temperature),
+            ("sky_conditions", self.sky_conditions),
+            ("present_weather", self.present_weather),
+        )
+        body = ",\n".join(f"    {name}={quotify(value)}" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body}\n)"
 
     def __str__(self) -> str:
         return self.report()
@@ -283,80 +382,92 @@ class MetarObservations:
         """Constructs a MetarObservations object using just the raw METAR."""
         return cls(CodedMetar(metar))
 
+    @classmethod
+    def parse_many(cls, metars: Iterable[str]) -> list[MetarObservations]:
+        """
+        Constructs MetarObservations objects for many raw METARs at once, e.g.
+        an archive of reports. Raises on the first METAR that fails to parse.
+        The current time is only read once for the whole batch.
+
+        Parameters:
+        * metars (Iterable[str]) -- Raw METAR observation strings
+        """
+        now = datetime.now(tz=timezone.utc)
+        return [cls(CodedMetar(metar), now) for metar in metars]
+
     def observed_on(self) -> str:
         """Human readable string for when the observation occured."""
-        ts = self.timestamp.strftime("%B %d, %Y at %H:%M UTC")
-        return f"Observed on {ts} ({self._minutes_since()} minutes ago)"
+        ts = self.timestamp
+        month = _MONTH_NAMES[ts.month - 1]
+        return (
+            f"Observed on {month} {ts.day:02d}, {ts.year} at "
+            f"{ts.hour:02d}:{ts.minute:02d} UTC ({self._minutes_since()} minutes ago)"
+        )
 
     def report(self) -> str:
         """Creates a full human readable report."""
-        # Header, station id
-        sb = self.station_id
-        # Raw METAR
-        sb = f"{sb}\n\nMETAR (via aviationweather.gov):\n'{self.coded_metar}'"
-        # Timestamp (acts as data header)
-        sb = f"{sb}\n\n{self.observed_on()}\n"
+        # Header, station id, raw METAR and timestamp (acts as data header)
+        lines = [
+            self.station_id,
+            "",
+            "METAR (via aviationweather.gov):",
+            f"'{self.coded_metar}'",
+            "",
+            self.observed_on(),
+            "",
+        ]
         # Wind
         if self.wind is None:
-            sb = f"{sb}\nWind: Unspecified"
+            lines.append("Wind: Unspecified")
         else:
-            sb = f"{sb}\nWind: {self.wind}"
+            lines.append(f"Wind: {self.wind}")
         # Visibility
         if self.visibility is None:
-            sb = f"{sb}\nVisibility: Unspecified"
+            lines.append("Visibility: Unspecified")
         else:
-            sb = f"{sb}\nVisibility: {self.visibility}"
+            lines.append(f"Visibility: {self.visibility}")
         # Pressure
-        sb = f"{sb}\nPressure:\n"
-        sb = f"{sb}  Altimeter -- {self.pressure.altimeter_inhg:.2f} inHg\n"
+        lines.append("Pressure:")
+        lines.append(f"  Altimeter -- {self.pressure.altimeter_inhg:.2f} inHg")
         if self.pressure.sea_level_hpa is not None:
-            sb = f"{sb}  Sea Level -- {self.pressure.sea_level_hpa:.1f} hPa"
+            lines.append(f"  Sea Level -- {self.pressure.sea_level_hpa:.1f} hPa")
         else:
-            sb = f"{sb}  Sea Level -- Unspecified"
+            lines.append("  Sea Level -- Unspecified")
         # Temperature
-        sb = f"{sb}\nTemperature:\n"
-        if self.temperature.temperature_c is None:
-            sb = f"{sb}  Unspecified"
+        lines.append("Temperature:")
+        temperature = self.temperature
+        if temperature.temperature_c is None:
+            lines.append("  Unspecified")
         else:
             # Air temperature
-            temp_str = "Unspecified"
-            if self.temperature.temperature_c is not None:
-                temp_str = f"{self.temperature.temperature_c:.1f} °C"
-            sb = f"{sb}  Air Temp -- {temp_str}"
-            # Dew point
-            temp_str = "Unspecified"
-            if self.temperature.dew_point_c is not None:
-                temp_str = f"{self.temperature.dew_point_c:.1f} °C"
-                sb = f"{sb}\n  Dew Point -- {temp_str}"
-                # Relative humidity
-                sb = f"{sb}\n  Relative Humidity -- "
-                sb = f"{sb}{self.temperature.relative_humidity:.0f}%"
-                # Wet bulb
-                temp_str = f"{self.temperature.wet_bulb_c:.1f} °C"
-                sb = f"{sb}\n  Wet Bulb -- {temp_str}"
+            lines.append(f"  Air Temp -- {temperature.temperature_c:.1f} °C")
+            if temperature.dew_point_c is not None:
+                # Dew point, relative humidity and wet bulb
+                lines.append(f"  Dew Point -- {temperature.dew_point_c:.1f} °C")
+                rel_hum = temperature.relative_humidity
+                lines.append(f"  Relative Humidity -- {rel_hum:.0f}%")
+                lines.append(f"  Wet Bulb -- {temperature.wet_bulb_c:.1f} °C")
                 # Wind chill/heat index
-                if self.temperature.temperature_c is not None:
-                    if self.temperature.temperature_c <= 10:
-                        wspeed = 0.0
-                        if self.wind is not None:
-                            wspeed = self.wind.speed_kt
-                        wc_c = calculators.wind_chill(
-                            temperature=self.temperature.temperature_c,
-                            wind_speed=wspeed,
-                            temp_unit="C",
-                            wind_unit="kt",
-                        )
-                        sb = f"{sb}\n  Wind Chill -- {wc_c:.1f} °C"
-                    else:
-                        temp_str = f"{self.temperature.heat_index_c:.1f} °C"
-                        sb = f"{sb}\n  Heat Index -- {temp_str}"
+                if temperature.temperature_c <= 10:
+                    wspeed = 0.0
+                    if self.wind is not None:
+                        wspeed = self.wind.speed_kt
+                    wc_c = calculators.wind_chill(
+                        temperature=temperature.temperature_c,
+                        wind_speed=wspeed,
+                        temp_unit="C",
+                        wind_unit="KTS",
+                    )
+                    lines.append(f"  Wind Chill -- {wc_c:.1f} °C")
+                else:
+                    lines.append(f"  Heat Index -- {temperature.heat_index_c:.1f} °C")
         # Sky cover
-        sb = f"{sb}\nSky Cover:\n"
+        lines.append("Sky Cover:")
         if (
             self.sky_conditions.sky_conditions is None
             or len(self.sky_conditions.sky_conditions) < 1
         ):
-            sb = f"{sb}  Clear skies\n"
+            lines.append("  Clear skies")
         else:
             for cond in self.sky_conditions.sky_conditions:
                 desc = cond.coverage_description
@@ -366,8 +477,9 @@ class MetarObservations:
                         height_str = f"{height_str} (Cumulonimbus)"
                 else:
                     height_str = "below station"
-                sb = f"{sb}  {desc} {height_str}\n"
-        return sb
+                lines.append(f"  {desc} {height_str}")
+        lines.append("")
+        return "\n".join(lines)
 
     def _get_present_weather(self) -> list[WeatherPhenomena]:
         lb: list[WeatherPhenomena] = []
@@ -377,28 +489,24 @@ class MetarObservations:
             lb.append(WeatherPhenomena(present_weather))
         return lb
 
-    def _parse_date_time(self, date_group: str) -> datetime:
+    def _parse_date_time(self, date_group: str, now: datetime | None) -> datetime:
         """
         Note: the decoded version of this method will assume that the month
-        and year of the data is the current month and year.
+        and year of the data is the month and year of now (a UTC datetime),
+        which defaults to the current time.
         """
-        metar_day_of_month = int(date_group[0:2])
-        metar_hour = int(date_group[2:4])
-        metar_minute = int(date_group[4:6])
-        current_dt = datetime.now(tz=timezone.utc)
-        metar_dt = datetime(
-            year=current_dt.year,
-            month=current_dt.month,
-            day=metar_day_of_month,
-            hour=metar_hour,
-            minute=metar_minute,
-            tzinfo=timezone.utc,
+        if now is None:
+            now = datetime.now(tz=timezone.utc)
+        return now.replace(
+            day=int(date_group[0:2]),
+            hour=int(date_group[2:4]),
+            minute=int(date_group[4:6]),
+            second=0,
+            microsecond=0,
         )
-        return metar_dt
 
     def _minutes_since(self) -> int:
-        seconds = (datetime.now(tz=timezone.utc) - self.timestamp).seconds
-        return round(seconds / 60)
+        return round((time.time() - self.timestamp.timestamp()) / 60)
 
 
 class MetarWind:
@@ -406,6 +514,14 @@ class MetarWind:
     Object for parsing/decoding the wind group from a coded METAR.
     """
 
+    __slots__ = (
+        "wind_group",
+        "speed_kt",
+        "gust_kt",
+        "direction",
+        "variable_directions",
+    )
+
     def __init__(self, metar_wind_group: str) -> None:
         self.wind_group = metar_wind_group.upper()
         # Default values indicate calm wind
@@ -429,13 +545,15 @@ class MetarWind:
                 self.variable_directions = (int(var_spl[0]), int(var_spl[1]))
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    wind_group={quotify(self.wind_group)},\n"
-        sb = f"{sb}    speed_kt={quotify(self.speed_kt)},\n"
-        sb = f"{sb}    gust_kt={quotify(self.gust_kt)},\n"
-        sb = f"{sb}    direction={quotify(self.direction)},\n"
-        sb = f"{sb}    variable_directions={quotify(self.variable_directions)},\n"
-        return f"{sb})"
+        fields = (
+            ("wind_group", self.wind_group),
+            ("speed_kt", self.speed_kt),
+            ("gust_kt", self.gust_kt),
+            ("direction", self.direction),
+            ("variable_directions", self.variable_directions),
+        )
+        body = "".join(f"    {name}={quotify(value)},\n" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body})"
 
     def __str__(self) -> str:
         return self.description()
@@ -448,15 +566,15 @@ class MetarWind:
             return "Calm"
         if self.direction is None:
             return f"{self.speed_kt:.0f} kt from varying directions"
-        sb = f"{self.speed_kt:.0f} kt"
-        sb = f"{sb} from the {cardinal_direction(self.direction)}"
+        direction = cardinal_direction(self.direction)
+        parts = [f"{self.speed_kt:.0f} kt from the {direction}"]
         if self.gust_kt is not None:
-            sb = f"{sb}, gusting {self.gust_kt:.0f} kt"
+            parts.append(f"gusting {self.gust_kt:.0f} kt")
         if self.variable_directions is not None:
             v1 = cardinal_direction(self.variable_directions[0])
             v2 = cardinal_direction(self.variable_directions[1])
-            sb = f"{sb}, varying from {v1} and {v2}"
-        return sb
+            parts.append(f"varying from {v1} and {v2}")
+        return ", ".join(parts)
 
     @classmethod
     def from_coded_metar(cls, metar: CodedMetar) -> MetarWind | None:
@@ -475,6 +593,8 @@ class MetarVisibility:
     Object for parsing/decoding the visibility group from a coded METAR.
     """
 
+    __slots__ = ("visibility_group", "distance_mi", "less_than_flag")
+
     def __init__(self, metar_vis_group: str) -> None:
         self.visibility_group = metar_vis_group.upper().strip()
         if self.visibility_group[0] == "M":
@@ -485,11 +605,13 @@ class MetarVisibility:
             self.less_than_flag = False
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    visibility_group={quotify(self.visibility_group)},\n"
-        sb = f"{sb}    distance_mi={quotify(self.distance_mi)},\n"
-        sb = f"{sb}    less_than_flag={quotify(self.less_than_flag)},\n"
-        return f"{sb})"
+        fields = (
+            ("visibility_group", self.visibility_group),
+            ("distance_mi", self.distance_mi),
+            ("less_than_flag", self.less_than_flag),
+        )
+        body = "".join(f"    {name}={quotify(value)},\n" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body})"
 
     def __str__(self) -> str:
         return self.description()
@@ -519,6 +641,13 @@ class MetarPressure:
     METAR.
     """
 
+    __slots__ = (
+        "altimeter_group",
+        "altimeter_inhg",
+        "remarks_slp",
+        "sea_level_hpa",
+    )
+
     def __init__(
         self, metar_altimeter_group: str, metar_slp_remark: str | None = None
     ) -> None:
@@ -534,12 +663,14 @@ class MetarPressure:
         self.sea_level_hpa = self._parse_slp()
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    altimeter_group={quotify(self.altimeter_group)},\n"
-        sb = f"{sb}    remarks_slp={quotify(self.remarks_slp)},\n"
-        sb = f"{sb}    altimeter_inhg={quotify(self.altimeter_inhg)},\n"
-        sb = f"{sb}    sea_level_hpa={quotify(self.sea_level_hpa)},\n"
-        return f"{sb})"
+        fields = (
+            ("altimeter_group", self.altimeter_group),
+            ("remarks_slp", self.remarks_slp),
+            ("altimeter_inhg", self.altimeter_inhg),
+            ("sea_level_hpa", self.sea_level_hpa),
+        )
+        body = "".join(f"    {name}={quotify(value)},\n" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body})"
 
     def __str__(self) -> str:
         return self.description()
@@ -562,10 +693,10 @@ class MetarPressure:
         """
         Outputs a human readable description of the decoded wind observations.
         """
-        sb = f"Altimeter {self.altimeter_inhg:.2f} inHg"
-        if self.sea_level_hpa is not None:
-            sb = f"{sb}, SLP {self.sea_level_hpa:.1f} hPa"
-        return sb
+        altimeter = f"Altimeter {self.altimeter_inhg:.2f} inHg"
+        if self.sea_level_hpa is None:
+            return altimeter
+        return f"{altimeter}, SLP {self.sea_level_hpa:.1f} hPa"
 
     @classmethod
     def from_coded_metar(cls, metar: CodedMetar) -> MetarPressure:
@@ -583,6 +714,21 @@ class MetarTemperature:
     Object for parsing/decoding the temperature group from a coded METAR.
     """
 
+    __slots__ = (
+        "temperature_group",
+        "temperature_remarks",
+        "temperature_c",
+        "dew_point_c",
+        "_relative_humidity",
+        "_heat_index_c",
+        "_wet_bulb_c",
+    )
+
+    # Filled in on first use, see the properties below
+    _relative_humidity: float | None
+    _heat_index_c: float | None
+    _wet_bulb_c: float | None
+
     def __init__(
         self, metar_temp_group: str | None, metar_temp_remark: str | None
     ) -> None:
@@ -608,31 +754,76 @@ class MetarTemperature:
             self.temperature_c = float(parts[0])
             if len(parts) > 1 and len(parts[1]) > 0:
                 self.dew_point_c = float(parts[1])
-        # If we have dew point, we can calculate RH, HI, and WB
-        self.relative_humidity = None
-        self.heat_index_c = None
-        self.wet_bulb_c = None
+        # RH, HI, and WB are calculated on first use and stored in their slots,
+        # assigning one directly overrides the calculated value
+
+    @property
+    def relative_humidity(self) -> float | None:
+        """Relative humidity (%), if both temperature and dew point are known."""
+        try:
+            return self._relative_humidity
+        except AttributeError:
+            pass
+        rel_hum = None
         if self.temperature_c is not None and self.dew_point_c is not None:
-            self.relative_humidity = calculators.relative_humidity(
+            rel_hum = calculators.relative_humidity(
                 self.temperature_c, self.dew_point_c, unit="C"
             )
-            self.heat_index_c = calculators.heat_index(
-                self.temperature_c, self.relative_humidity, unit="C"
-            )
-            self.wet_bulb_c = calculators.wet_bulb(
-                self.temperature_c, self.relative_humidity, unit="C"
-            )
+        self._relative_humidity = rel_hum
+        return rel_hum
+
+    @relative_humidity.setter
+    def relative_humidity(self, value: float | None) -> None:
+        self._relative_humidity = value
+
+    @property
+    def heat_index_c(self) -> float | None:
+        """Heat index (°C), if both temperature and dew point are known."""
+        try:
+            return self._heat_index_c
+        except AttributeError:
+            pass
+        heat_index = None
+        rel_hum = self.relative_humidity
+        if self.temperature_c is not None and rel_hum is not None:
+            heat_index = calculators.heat_index(self.temperature_c, rel_hum, unit="C")
+        self._heat_index_c = heat_index
+        return heat_index
+
+    @heat_index_c.setter
+    def heat_index_c(self, value: float | None) -> None:
+        self._heat_index_c = value
+
+    @property
+    def wet_bulb_c(self) -> float | None:
+        """Wet bulb temperature (°C), if both temperature and dew point are known."""
+        try:
+            return self._wet_bulb_c
+        except AttributeError:
+            pass
+        wet_bulb = None
+        rel_hum = self.relative_humidity
+        if self.temperature_c is not None and rel_hum is not None:
+            wet_bulb = calculators.wet_bulb(self.temperature_c, rel_hum, unit="C")
+        self._wet_bulb_c = wet_bulb
+        return wet_bulb
+
+    @wet_bulb_c.setter
+    def wet_bulb_c(self, value: float | None) -> None:
+        self._wet_bulb_c = value
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    temperature_group={quotify(self.temperature_group)},\n"
-        sb = f"{sb}    temperature_remarks={quotify(self.temperature_remarks)},\n"
-        sb = f"{sb}    temperature_c={quotify(self.temperature_c)},\n"
-        sb = f"{sb}    dew_point_c={quotify(self.dew_point_c)},\n"
-        sb = f"{sb}    relative_humidity={quotify(self.relative_humidity)},\n"
-        sb = f"{sb}    heat_index_c={quotify(self.heat_index_c)},\n"
-        sb = f"{sb}    wet_bulb_c={quotify(self.wet_bulb_c)},\n"
-        return f"{sb})"
+        fields = (
+            ("temperature_group", self.temperature_group),
+            ("temperature_remarks", self.temperature_remarks),
+            ("temperature_c", self.temperature_c),
+            ("dew_point_c", self.dew_point_c),
+            ("relative_humidity", self.relative_humidity),
+            ("heat_index_c", self.heat_index_c),
+            ("wet_bulb_c", self.wet_bulb_c),
+        )
+        body = "".join(f"    {name}={quotify(value)},\n" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body})"
 
     def __str__(self) -> str:
         return self.description()
@@ -643,14 +834,16 @@ class MetarTemperature:
         """
         if self.temperature_c is None:
             return "Unspecified"
-        sb = f"{self.temperature_c:.1f} °C"
+        parts = [f"{self.temperature_c:.1f} °C"]
         if self.dew_point_c is not None:
-            sb = f"{sb}, DP {self.dew_point_c:.1f} °C"
-        if self.heat_index_c is not None:
-            sb = f"{sb}, HI {self.heat_index_c:.1f} °C"
-        if self.wet_bulb_c is not None:
-            sb = f"{sb}, WB {self.wet_bulb_c:.1f} °C"
-        return sb
+            parts.append(f"DP {self.dew_point_c:.1f} °C")
+        heat_index = self.heat_index_c
+        if heat_index is not None:
+            parts.append(f"HI {heat_index:.1f} °C")
+        wet_bulb = self.wet_bulb_c
+        if wet_bulb is not None:
+            parts.append(f"WB {wet_bulb:.1f} °C")
+        return ", ".join(parts)
 
     @classmethod
     def from_coded_metar(cls, metar: CodedMetar) -> MetarTemperature:
@@ -667,15 +860,19 @@ class MetarSkyCondition:
     Object for parsing/decoding the sky condition group from a coded METAR.
     """
 
+    __slots__ = ("sky_condition_group", "sky_conditions")
+
     def __init__(self, metar_sky_group: str) -> None:
         self.sky_condition_group = metar_sky_group.upper().strip()
         self.sky_conditions = self._sky_metar_parse()
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    sky_condition_group={quotify(self.sky_condition_group)},\n"
-        sb = f"{sb}    sky_conditions={quotify(self.sky_conditions)},\n"
-        return f"{sb})"
+        fields = (
+            ("sky_condition_group", self.sky_condition_group),
+            ("sky_conditions", self.sky_conditions),
+        )
+        body = "".join(f"    {name}={quotify(value)},\n" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body})"
 
     def __str__(self) -> str:
         return self.description()
@@ -685,11 +882,13 @@ class MetarSkyCondition:
             return None
         sky: list[SkyLayer] = []
         for cond in self.sky_condition_group.split():
-            contraction = cond[0:3]
+            # Vertical visibility is the only two letter contraction
+            contraction = "VV" if cond.startswith("VV") else cond[0:3]
             if "/" in cond:
                 height = None
             else:
-                height = int(cond[3:6]) * 100
+                height_index = len(contraction)
+                height = int(cond[height_index : height_index + 3]) * 100
             cb_flag = True if "CB" in cond else False
             sky.append(SkyLayer(contraction, height, cb_flag))
         return sky
@@ -700,7 +899,7 @@ class MetarSkyCondition:
         """
         if self.sky_conditions is None or len(self.sky_conditions) < 1:
             return "Clear skies"
-        sb = ""
+        layers: list[str] = []
         for cond in self.sky_conditions:
             desc = cond.coverage_description
             if cond.height_ft is not None:
@@ -709,8 +908,8 @@ class MetarSkyCondition:
                     height_str = f"{height_str} (Cumulonimbus)"
             else:
                 height_str = "below station"
-            sb = f"{sb}, {desc} {height_str}"
-        return sb[2:]
+            layers.append(f"{desc} {height_str}")
+        return ", ".join(layers)
 
     @classmethod
     def from_coded_metar(cls, metar: CodedMetar) -> MetarSkyCondition:
@@ -726,6 +925,8 @@ class WeatherPhenomena:
     Object for individual weather phenomena/present weather conditions.
     """
 
+    __slots__ = ("intensity", "descriptor", "precipitation", "obscuration", "other")
+
     _descriptors = {
         "MI": "Shallow",
         "PR": "Partial",
@@ -810,29 +1011,25 @@ class WeatherPhenomena:
                     self.other = part
 
     def __repr__(self) -> str:
-        sb = f"{self.__class__.__name__}(\n"
-        sb = f"{sb}    intensity={quotify(self.intensity)},\n"
-        sb = f"{sb}    descriptor={quotify(self.descriptor)},\n"
-        sb = f"{sb}    precipitation={quotify(self.precipitation)},\n"
-        sb = f"{sb}    obscuration={quotify(self.obscuration)},\n"
-        sb = f"{sb}    other={quotify(self.other)},\n"
-        return f"{sb})"
+        fields = (
+            ("intensity", self.intensity),
+            ("descriptor", self.descriptor),
+            ("precipitation", self.precipitation),
+            ("obscuration", self.obscuration),
+            ("other", self.other),
+        )
+        body = "".join(f"    {name}={quotify(value)},\n" for name, value in fields)
+        return f"{self.__class__.__name__}(\n{body})"
 
     def __str__(self) -> str:
-        if self.intensity is not None:
-            sb = f"{self.intensity}"
-        else:
-            sb = ""
-        if self.descriptor is not None:
-            sb = f"{sb}{self.descriptor}"
-        if len(self.precipitation) > 0:
-            for precip in self.precipitation:
-                sb = f"{sb}{precip}"
-        if self.obscuration is not None:
-            sb = f"{sb}{self.obscuration}"
-        if self.other is not None:
-            sb = f"{sb}{self.other}"
-        return sb
+        groups = (
+            self.intensity,
+            self.descriptor,
+            *self.precipitation,
+            self.obscuration,
+            self.other,
+        )
+        return "".join(group for group in groups if group is not None)
 
     def _intensity_str(self) -> str:
         if self.intensity is not None:
@@ -850,12 +1047,8 @@ class WeatherPhenomena:
         return ""
 
     def _precip_str(self) -> str:
-        if len(self.precipitation) > 0:
-            sb = ""
-            for precip in self.precipitation:
-                sb = f"{sb} {self._precips.get(precip, '')}"
-            return sb.strip()
-        return ""
+        precips = (self._precips.get(precip, "") for precip in self.precipitation)
+        return " ".join(precips).strip()
 
     def _obsc_str(self) -> str:
         if self.obscuration is not None:
@@ -0,0 +1,40 @@
+"""
+Tests for the meteorological calculators
+"""
+
+import unittest
+
+from wxtools import calculators
+
+
+class TestSaturationVaporPressure(unittest.TestCase):
+    def test_above_freezing(self) -> None:
+        svp = calculators.saturation_vapor_pressure
+        self.assertAlmostEqual(svp(0, "C"), 6.1094, places=4)
+        self.assertAlmostEqual(svp(0.5, "C"), 6.3345, places=4)
+        self.assertAlmostEqual(svp(5, "C"), 8.7156, places=4)
+
+    def test_below_freezing(self) -> None:
+        svp = calculators.saturation_vapor_pressure
+        self.assertAlmostEqual(svp(-0.5, "C"), 5.8608, places=4)
+        self.assertAlmostEqual(svp(-1e-9, "C"), 6.1078, places=4)
+
+    def test_step_at_freezing(self) -> None:
+        # The water and ice fits use different bases
+        svp = calculators.saturation_vapor_pressure
+        self.assertAlmostEqual(svp(0, "C") - svp(-1e-9, "C"), 0.0016, places=4)
+
+
+class TestRelativeHumidity(unittest.TestCase):
+    def test_both_above_freezing(self) -> None:
+        self.assertEqual(calculators.relative_humidity(5, 1, "C"), 75.35)
+
+    def test_dew_point_below_freezing(self) -> None:
+        self.assertEqual(calculators.relative_humidity(5, -2, "C"), 59.36)
+        self.assertEqual(calculators.relative_humidity(41, 5, "C"), 11.2)
+
+    def test_both_below_freezing(self) -> None:
+        self.assertEqual(calculators.relative_humidity(-1, -4, "C"), 77.73)
+
+    def test_fahrenheit(self) -> None:
+        self.assertEqual(calculators.relative_humidity(41, 32, "F"), 70.08)
@@ -0,0 +1,161 @@
+"""
+Tests for splitting and decoding coded METARs
+"""
+
+import unittest
+from unittest import mock
+
+from wxtools import calculators
+from wxtools.metar import (
+    _METAR_BODY,
+    CodedMetar,
+    MetarObservations,
+    MetarSkyCondition,
+    MetarTemperature,
+    SkyLayer,
+)
+
+_GROUPS = (
+    "report_type",
+    "station_id",
+    "date_time",
+    "report_modifier",
+    "wind",
+    "visibility",
+    "runway_visual_range",
+    "present_weather",
+    "sky_condition",
+    "temperature",
+    "altimeter",
+    "remarks",
+)
+
+# Reports the single regex match is expected to handle
+_WELL_FORMED = (
+    "KBDL 101351Z 03013G20KT 10SM FEW060 FEW250 17/M03 A3042 RMK AO2 SLP300",
+    "METAR KBDL 151638Z 19008KT 160V220 10SM SCT028 BKN036 BKN120 25/17 A2985",
+    "SPECI KBDL 152337Z 20010KT 10SM TS FEW046CB SCT090 BKN200 23/17 A2977",
+    "KBDL 160951Z AUTO 16005KT 1/2SM R06/P6000FT BR OVC002 17/16 A2974 RMK AO2",
+    "KBDL 161239Z COR 00000KT 1/4SM R06/P6000FT -DZ HZ VV002 20/17 A2974",
+    "KBDL 161239Z VRB03KT 1/4SM FG VV001 M05/ A2974",
+    "KBDL 161239Z 24005KT 10SM CLR M02/M08 A3012 RMK AO2 T10221083",
+    "KBDL 160836Z 17004KT 1 1/2SM BR BKN003 OVC005 17/16 A2974 RMK AO2",
+)
+
+# Reports that fall back to the group by group parsing
+_FALLBACK = (
+    "KBDL 161239Z AUTO 18004KT 10SM CLR A3012 RMK AO2",
+    "KBDL 161239Z 18004KT 10SM FEW/// 17/16 A3012",
+)
+
+
+def _split_groups(metar: str) -> CodedMetar:
+    """Splits a METAR using only the group by group parsing."""
+    coded = object.__new__(CodedMetar)
+    split_obs = metar.upper().split(" RMK ", maxsplit=2)
+    coded._split_groups(split_obs[0])
+    coded.remarks = split_obs[1] if len(split_obs) > 1 else None
+    return coded
+
+
+class TestCodedMetar(unittest.TestCase):
+    def test_fast_path_matches(self) -> None:
+        for metar in _WELL_FORMED:
+            with self.subTest(metar=metar):
+                body = metar.split(" RMK ", maxsplit=2)[0]
+                self.assertIsNotNone(_METAR_BODY.fullmatch(body))
+
+    def test_fallback_does_not_match(self) -> None:
+        for metar in _FALLBACK:
+            with self.subTest(metar=metar):
+                body = metar.split(" RMK ", maxsplit=2)[0]
+                self.assertIsNone(_METAR_BODY.fullmatch(body))
+
+    def test_fast_path_agrees_with_split_groups(self) -> None:
+        for metar in _WELL_FORMED + _FALLBACK:
+            expected = _split_groups(metar)
+            actual = CodedMetar(metar)
+            for group in _GROUPS:
+                with self.subTest(metar=metar, group=group):
+                    self.assertEqual(getattr(actual, group), getattr(expected, group))
+
+
+class TestMetarTemperature(unittest.TestCase):
+    def test_derived_values(self) -> None:
+        temp = MetarTemperature("20/10", None)
+        self.assertEqual(temp.relative_humidity, 52.54)
+        self.assertIsNotNone(temp.heat_index_c)
+        self.assertIsNotNone(temp.wet_bulb_c)
+
+    def test_missing_dew_point(self) -> None:
+        temp = MetarTemperature("M05/", None)
+        self.assertIsNone(temp.relative_humidity)
+        self.assertIsNone(temp.heat_index_c)
+        self.assertIsNone(temp.wet_bulb_c)
+
+    def test_assign_then_read(self) -> None:
+        temp = MetarTemperature("20/10", None)
+        temp.relative_humidity = 50.0
+        temp.heat_index_c = 21.5
+        temp.wet_bulb_c = None
+        self.assertEqual(temp.relative_humidity, 50.0)
+        self.assertEqual(temp.heat_index_c, 21.5)
+        self.assertIsNone(temp.wet_bulb_c)
+
+    def test_read_then_assign(self) -> None:
+        temp = MetarTemperature("20/10", None)
+        self.assertEqual(temp.relative_humidity, 52.54)
+        self.assertIsNotNone(temp.wet_bulb_c)
+        temp.relative_humidity = 75.0
+        temp.wet_bulb_c = 12.0
+        self.assertEqual(temp.relative_humidity, 75.0)
+        self.assertEqual(temp.wet_bulb_c, 12.0)
+
+    def test_description_skips_unset_values(self) -> None:
+        temp = MetarTemperature("20/10", None)
+        temp.heat_index_c = None
+        temp.wet_bulb_c = 14.0
+        self.assertEqual(temp.description(), "20.0 °C, DP 10.0 °C, WB 14.0 °C")
+        temp.wet_bulb_c = None
+        self.assertEqual(temp.description(), "20.0 °C, DP 10.0 °C")
+
+
+class TestMetarSkyCondition(unittest.TestCase):
+    def test_vertical_visibility(self) -> None:
+        sky = MetarSkyCondition("VV001")
+        self.assertEqual(sky.sky_conditions, [SkyLayer("VV", 100)])
+        self.assertEqual(sky.description(), "Vertical Visibility at 100 ft")
+
+    def test_vertical_visibility_unknown_height(self) -> None:
+        sky = MetarSkyCondition("VV///")
+        self.assertEqual(sky.sky_conditions, [SkyLayer("VV", None)])
+        self.assertEqual(sky.description(), "Vertical Visibility below station")
+
+    def test_vertical_visibility_is_not_weather(self) -> None:
+        for group in ("VV001", "VV///"):
+            with self.subTest(group=group):
+                obs = MetarObservations.from_raw_string(
+                    f"KBDL 161239Z 00000KT 1/4SM FG {group} M05/M06 A2974"
+                )
+                self.assertEqual(obs.coded_metar.sky_condition, group)
+                self.assertEqual(obs.coded_metar.present_weather, "FG")
+
+
+class TestMetarObservationsReport(unittest.TestCase):
+    def test_wind_chill_in_knots(self) -> None:
+        obs = MetarObservations.from_raw_string(
+            "KBDL 161239Z 24015KT 10SM CLR M02/M08 A3012 RMK AO2 T10221083"
+        )
+        with mock.patch.object(
+            calculators, "wind_chill", wraps=calculators.wind_chill
+        ) as wind_chill:
+            report = obs.report()
+        wind_chill.assert_called_once_with(
+            temperature=-2.2, wind_speed=15, temp_unit="C", wind_unit="KTS"
+        )
+        expected = calculators.wind_chill(-2.2, 15, temp_unit="C", wind_unit="KTS")
+        self.assertIn(f"  Wind Chill -- {expected:.1f} °C", report.splitlines())
+
+
+if __name__ == "__main__":
+    unittest.main()
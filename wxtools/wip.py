@@ -1,10 +1,28 @@
 """Random work in progress stuff for development"""
 
 from __future__ import annotations
-from typing import Any
+import threading
+from typing import Any, Iterable
 
 import requests
 
+from .errors import AviationWeatherStationError
+
+# Sessions for the aviationweather.gov helpers so repeated lookups reuse an open
+# keep-alive connection instead of doing a new TCP/TLS handshake every call.
+# requests.Session is not thread safe, so each thread gets its own.
+_AVIATIONWEATHER_SESSIONS = threading.local()
+
+
+def _aviationweather_session() -> requests.Session:
+    session: requests.Session | None = getattr(
+        _AVIATIONWEATHER_SESSIONS, "session", None
+    )
+    if session is None:
+        session = requests.Session()
+        _AVIATIONWEATHER_SESSIONS.session = session
+    return session
+
 
 def aviationweather_get_metar(station_id: str) -> str:
     """Returns the latest METAR from the given station."""
@@ -14,7 +32,7 @@ def aviationweather_get_metar(station_id: str) -> str:
         f"?ids={station_id}&format=raw&taf=false"
     )
     try:
-        resp = requests.get(url=url, timeout=5)
+        resp = _aviationweather_session().get(url=url, timeout=5)
         resp.raise_for_status()
         metar_raw = resp.text.strip().upper()
         if len(metar_raw) == 0:
@@ -24,19 +42,52 @@ def aviationweather_get_metar(station_id: str) -> str:
         raise RuntimeError(ex) from None
 
 
+def aviationweather_get_metars(station_ids: Iterable[str]) -> dict[str, str]:
+    """
+    Returns the latest METARs from all of the given stations using a single
+    request, keyed by the station ID in each report. Stations that did not
+    report are missing from the result.
+    """
+
+    ids = ",".join(station_ids)
+    url = f"https://aviationweather.gov/api/data/metar?ids={ids}&format=raw&taf=false"
+    try:
+        resp = _aviationweather_session().get(url=url, timeout=5)
+        resp.raise_for_status()
+        metars: dict[str, str] = {}
+        for line in resp.text.splitlines():
+            metar_raw = line.strip().upper()
+            groups = metar_raw.split(maxsplit=2)
+            if len(groups) > 0 and groups[0] in ("METAR", "SPECI"):
+                groups = groups[1:]
+            if len(groups) > 0:
+                metars.setdefault(groups[0], metar_raw)
+        return metars
+    except requests.RequestException as ex:
+        raise RuntimeError(ex) from None
+
+
 def aviationweather_get_info(station_id: str) -> dict[str, Any]:
-    """Returns the latest info from the given station."""
+    """
+    Returns the latest info from the given station. Raises
+    AviationWeatherStationError if the station is not known.
+    """
 
     url = (
         "https://aviationweather.gov/api/data/stationinfo"
         f"?ids={station_id}&format=json"
     )
     try:
-        resp = requests.get(url=url, timeout=5)
+        resp = _aviationweather_session().get(url=url, timeout=5)
         resp.raise_for_status()
+        # No content or an empty list both mean there is no such station
+        if resp.status_code == 204:
+            raise AviationWeatherStationError(f"Unknown station '{station_id}'.")
         jdata = resp.json()
         if isinstance(jdata, list):
-            if len(jdata) > 0 and isinstance(jdata[0], dict):
+            if len(jdata) == 0:
+                raise AviationWeatherStationError(f"Unknown station '{station_id}'.")
+            if isinstance(jdata[0], dict):
                 return jdata[0]
         raise RuntimeError("Unknown payload data in response.")
     except requests.RequestException as ex: